@@ -1,17 +1,129 @@
+import asyncio
+import functools
+import hashlib
 import json
-import yaml
-from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from providers import ProviderFactory
+from text_utils import (
+    MIN_SIMILARITY_LENGTH,
+    SIMILARITY_THRESHOLD,
+    dumps,
+    fingerprint_similarity,
+    loads,
+    shingle_fingerprint,
+)
 from tools import discover_tools
 
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file once per (path, mtime, size) signature."""
+    # yaml is only needed on the first parse, so it is imported here rather than at startup.
+    import yaml
+
+    # Prefer the libyaml-backed loader; fall back to the pure-Python one when unavailable.
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
+def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
+    """
+    Load a YAML config, reusing the parsed result while the file is unchanged.
+
+    The returned dict is shared between callers and must be treated as read-only.
+    """
+    path = os.path.abspath(config_path)
+    stat = os.stat(path)
+    return _parse_config(path, stat.st_mtime_ns, stat.st_size)
+
+
+def _config_fingerprint(config: Dict[str, Any]) -> str:
+    """Stable content hash of a config dict, equal for configs that parse to the same data."""
+    canonical = json.dumps(config, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def _advance_loop(agent_loop: Any, response: Any) -> tuple:
+    """Send a response into an agent loop; returns (finished, next messages or final text)."""
+    # StopIteration cannot cross a Future boundary, so it is converted into a flag here.
+    try:
+        return False, agent_loop.send(response)
+    except StopIteration as stop:
+        return True, stop.value
+
+
+# Final answers of earlier runs, keyed by _response_cache_key(); used when agent.response_cache is on.
+_response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+_NO_RESPONSE_MESSAGE = (
+    "I apologize, but I couldn't generate a meaningful response. Please try rephrasing your question."
+)
+
+
+def _get_cached_response(key: str, ttl: float) -> Optional[str]:
+    """Return a cached final response that is younger than ttl seconds."""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > ttl:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return response
+
+
+def _store_cached_response(key: str, response: str, max_entries: int) -> None:
+    """Remember a final response, evicting the least recently used entries beyond max_entries."""
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic(), response)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > max_entries:
+            _response_cache.popitem(last=False)
+
+
+def _partial_to_tool_call(partial: Dict[str, Any]) -> Dict[str, Any]:
+    """Assemble a streamed tool call from its accumulated fragments."""
+    return {
+        "id": partial['id'],
+        "type": "function",
+        "function": {
+            "name": partial['name'],
+            "arguments": "".join(partial['arguments']) or "{}"
+        }
+    }
+
+
+def _tool_call_key(tool_call: Dict[str, Any]) -> tuple:
+    """Identity of a normalized tool call, used to match calls started while streaming."""
+    function_data = tool_call['function']
+    return tool_call['id'], function_data['name'], function_data['arguments']
+
+
+# Sentinel for cache lookups where None is a legitimate cached value.
+_MISSING = object()
+
+# Upper bound on tool calls from a single assistant turn that run concurrently.
+_MAX_TOOL_WORKERS = 8
+
+
 class AIAgent:
     """AI Agent that works with any provider through the provider abstraction."""
+
+    # Discovered tools, provider schemas and tool mapping shared by agents using the same config.
+    _tools_cache: Dict[str, tuple] = {}
     
     def __init__(self, config_path="config.yaml", provider_name=None, silent=False):
-        # Load configuration
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        # Load configuration (parsed once and shared across agents)
+        self.config = load_config(config_path)
         
         # Silent mode for orchestrator (suppresses debug output)
         self.silent = silent
@@ -28,14 +140,17 @@ class AIAgent:
         # Initialize provider using factory
         self.provider = ProviderFactory.create_provider(provider_name, provider_config)
         
-        # Discover tools dynamically
-        self.discovered_tools = discover_tools(self.config, silent=self.silent)
-        
-        # Build tools array for the provider
-        self.tools = [tool.to_openrouter_schema() for tool in self.discovered_tools.values()]
-        
-        # Build tool mapping
-        self.tool_mapping = {name: tool.execute for name, tool in self.discovered_tools.items()}
+        # Discover tools, build the provider tools array and the tool mapping (once per config)
+        self.discovered_tools, self.tools, self.tool_mapping, self._idempotent_tools = self._load_tools()
+
+        # Results of idempotent tools, keyed by (tool name, canonical JSON args); reset every run
+        self._tool_cache: Dict[tuple, Any] = {}
+
+        # System message reused by every run; messages are only appended to, never edited in place
+        self._system_message = {"role": "system", "content": self.config['system_prompt']}
+
+        # Worker pool for concurrent tool calls, created lazily by _execute_tool_calls
+        self._tool_executor: Optional[ThreadPoolExecutor] = None
         
         # Store provider info for display
         self.provider_info = self.provider.get_provider_info()
@@ -43,16 +158,33 @@ class AIAgent:
         if not self.silent:
             print(f"🤖 AI Agent initialized with {self.provider_info['display_name']} ({self.provider_info['model']})")
 
+    def _load_tools(self):
+        """Return (discovered_tools, tools, tool_mapping, idempotent tool names), shared per config."""
+        # Tools read arbitrary config sections (e.g. search settings), so the whole config is fingerprinted.
+        cache_key = _config_fingerprint(self.config)
+        cached = AIAgent._tools_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        discovered_tools = discover_tools(self.config, silent=self.silent)
+        tools = [tool.to_openrouter_schema() for tool in discovered_tools.values()]
+        tool_mapping = {name: tool.execute for name, tool in discovered_tools.items()}
+        idempotent_tools = frozenset(
+            name for name, tool in discovered_tools.items() if getattr(tool, 'idempotent', False)
+        )
+        cached = (discovered_tools, tools, tool_mapping, idempotent_tools)
+        AIAgent._tools_cache[cache_key] = cached
+        return cached
+
     def _normalize_tool_call(self, tool_call: Any) -> Optional[Dict[str, Any]]:
         """Normalize provider-specific tool call formats into a plain dict."""
-        if tool_call is None:
-            return None
-
         if isinstance(tool_call, dict):
             call_id = tool_call.get('id')
             function_data = tool_call.get('function', {}) or {}
             name = function_data.get('name')
             arguments = function_data.get('arguments', "{}")
+        elif tool_call is None:
+            return None
         else:
             call_id = getattr(tool_call, 'id', None)
             function_obj = getattr(tool_call, 'function', None)
@@ -63,7 +195,7 @@ class AIAgent:
             return None
 
         if isinstance(arguments, (dict, list)):
-            arguments = json.dumps(arguments)
+            arguments = dumps(arguments)
         elif arguments is None:
             arguments = "{}"
         elif not isinstance(arguments, str):
@@ -92,18 +224,18 @@ class AIAgent:
 
     def _parse_tool_arguments(self, raw_arguments: Any) -> Dict[str, Any]:
         """Parse tool call arguments safely and always return a dict."""
-        if raw_arguments is None:
-            return {}
-
-        if isinstance(raw_arguments, dict):
-            return raw_arguments
-
+        # Providers almost always hand over a JSON string, so that path is tested first.
         if isinstance(raw_arguments, str):
-            raw_arguments = raw_arguments.strip()
+            # Argument-less calls send "{}"; skip the parser for them.
+            if raw_arguments == "{}":
+                return {}
+            # Compact JSON is the norm, so only pay for strip() when there is edge whitespace.
+            if raw_arguments[:1].isspace() or raw_arguments[-1:].isspace():
+                raw_arguments = raw_arguments.strip()
             if not raw_arguments:
                 return {}
             try:
-                parsed = json.loads(raw_arguments)
+                parsed = loads(raw_arguments)
             except json.JSONDecodeError as exc:
                 raise ValueError(f"Invalid JSON arguments: {exc}") from exc
 
@@ -111,6 +243,12 @@ class AIAgent:
                 return parsed
             raise ValueError("Tool arguments JSON must decode to an object")
 
+        if raw_arguments is None:
+            return {}
+
+        if isinstance(raw_arguments, dict):
+            return raw_arguments
+
         raise ValueError("Unsupported tool arguments format")
 
     def _finalize_response_content(self, content_blocks: List[str]) -> str:
@@ -118,65 +256,233 @@ class AIAgent:
         if not content_blocks:
             return ""
 
-        deduplicated_blocks: List[str] = []
-        normalized_blocks: List[str] = []
+        # Normalize and fingerprint every block once; the pairwise loop only does index lookups.
+        blocks = [stripped for stripped in (block.strip() for block in content_blocks) if stripped]
+        # Most runs produce a single block, which needs no deduplication at all.
+        if len(blocks) <= 1:
+            return blocks[0] if blocks else ""
+
+        norms = [" ".join(block.lower().split()) for block in blocks]
+        if len(blocks) == 2 and norms[0] == norms[1]:
+            return blocks[0]
+        fingerprints = [
+            shingle_fingerprint(normalized) if len(normalized) >= MIN_SIMILARITY_LENGTH else None
+            for normalized in norms
+        ]
+        sizes = [len(fingerprint) if fingerprint is not None else 0 for fingerprint in fingerprints]
 
-        for block in content_blocks:
-            stripped = block.strip()
-            if not stripped:
+        kept: List[int] = []
+        seen_norms = set()
+        for index, normalized in enumerate(norms):
+            # Exact repeats are the common case and cost one set lookup.
+            if normalized in seen_norms:
                 continue
 
-            normalized = " ".join(stripped.lower().split())
+            fingerprint = fingerprints[index]
+            size = sizes[index]
             is_duplicate = False
 
-            for existing_normalized in normalized_blocks:
-                if normalized == existing_normalized:
+            # Only blocks long enough to be fingerprinted take part in the similarity pass.
+            for kept_index in kept if fingerprint is not None else ():
+                existing_fingerprint = fingerprints[kept_index]
+                if existing_fingerprint is None:
+                    continue
+
+                # Dice is bounded by 2*min/(a+b); skip pairs whose sizes already rule out a match.
+                existing_size = sizes[kept_index]
+                if 2.0 * min(size, existing_size) < SIMILARITY_THRESHOLD * (size + existing_size):
+                    continue
+                if fingerprint_similarity(fingerprint, existing_fingerprint) >= SIMILARITY_THRESHOLD:
                     is_duplicate = True
                     break
 
-                if len(normalized) >= 100 and len(existing_normalized) >= 100:
-                    similarity = SequenceMatcher(None, normalized, existing_normalized).ratio()
-                    if similarity >= 0.94:
-                        is_duplicate = True
-                        break
-
             if not is_duplicate:
-                deduplicated_blocks.append(stripped)
-                normalized_blocks.append(normalized)
+                kept.append(index)
+                seen_norms.add(normalized)
+
+        return "\n\n".join(blocks[index] for index in kept)
 
-        return "\n\n".join(deduplicated_blocks)
+    def call_llm(self, messages, include_tools: bool = True, stream: bool = False):
+        """
+        Make API call to the configured provider, optionally with tools.
 
-    def call_llm(self, messages, include_tools: bool = True):
-        """Make API call to the configured provider, optionally with tools."""
+        With stream=True an iterator of provider deltas is returned instead of a full response.
+        """
+        tools = self.tools if include_tools and self.tools else None
+        if stream:
+            return self._stream_llm(messages, tools)
         try:
             response = self.provider.create_chat_completion(
                 messages=messages,
-                tools=self.tools if include_tools and self.tools else None
+                tools=tools
             )
             return response
-        except ImportError as e:
-            raise Exception(f"Provider dependency missing: {str(e)}. Install required packages.")
-        except ValueError as e:
-            raise Exception(f"Invalid request: {str(e)}")
         except Exception as e:
-            error_type = type(e).__name__
-            error_msg = str(e)
-            raise Exception(f"LLM call failed ({error_type}): {error_msg}")
+            raise self._llm_call_error(e)
+
+    async def acall_llm(self, messages, include_tools: bool = True):
+        """Asynchronous call_llm(): awaits the provider without blocking the event loop."""
+        tools = self.tools if include_tools and self.tools else None
+        try:
+            return await self.provider.acreate_chat_completion(
+                messages=messages,
+                tools=tools
+            )
+        except Exception as e:
+            raise self._llm_call_error(e)
+
+    def _stream_llm(self, messages, tools) -> Iterator[Dict[str, Any]]:
+        """Iterate provider stream deltas, translating failures like call_llm does."""
+        try:
+            yield from self.provider.stream_chat_completion(messages=messages, tools=tools)
+        except Exception as e:
+            raise self._llm_call_error(e)
+
+    def _llm_call_error(self, error: Exception) -> Exception:
+        """Wrap a provider failure in the agent's user-facing error message."""
+        if isinstance(error, ImportError):
+            return Exception(f"Provider dependency missing: {str(error)}. Install required packages.")
+        if isinstance(error, ValueError):
+            return Exception(f"Invalid request: {str(error)}")
+        error_type = type(error).__name__
+        error_msg = str(error)
+        return Exception(f"LLM call failed ({error_type}): {error_msg}")
+
+    def _collect_stream(self, deltas: Iterator[Dict[str, Any]]):
+        """
+        Accumulate streamed deltas into a regular completion response.
+
+        Content is yielded in small batches while it arrives; the generator's return
+        value is the assembled response in the same shape create_chat_completion returns.
+        """
+        agent_config = self.config.get('agent', {})
+        batch_chars = int(agent_config.get('stream_batch_chars', 32))
+        batch_interval = float(agent_config.get('stream_batch_interval', 0.05))
+
+        content_parts: List[str] = []
+        pending: List[str] = []
+        pending_chars = 0
+        last_flush = time.monotonic()
+        complete_tool_calls: List[Any] = []
+        partial_tool_calls: Dict[int, Dict[str, Any]] = {}
+        # Read-only calls that finished mid-stream and were started before the stream ended
+        prestarted: Dict[tuple, Future] = {}
+        last_index = None
+
+        for delta in deltas:
+            fragment = delta.get('content')
+            if fragment:
+                content_parts.append(fragment)
+                pending.append(fragment)
+                pending_chars += len(fragment)
+                now = time.monotonic()
+                if pending_chars >= batch_chars or now - last_flush >= batch_interval:
+                    yield "".join(pending)
+                    pending = []
+                    pending_chars = 0
+                    last_flush = now
+
+            for tool_delta in delta.get('tool_calls') or ():
+                index = tool_delta.get('index') if isinstance(tool_delta, dict) else None
+                if index is None:
+                    # Providers without native streaming hand over whole tool calls.
+                    complete_tool_calls.append(tool_delta)
+                    continue
+
+                if index != last_index:
+                    # Calls are streamed one after another, so a new index means the previous one is complete.
+                    if last_index is not None and last_index in partial_tool_calls:
+                        self._prestart_tool_call(_partial_to_tool_call(partial_tool_calls[last_index]), prestarted)
+                    last_index = index
+
+                # OpenAI-style streams split each call into fragments that share an index.
+                partial = partial_tool_calls.setdefault(index, {'id': None, 'name': "", 'arguments': []})
+                if tool_delta.get('id'):
+                    partial['id'] = tool_delta['id']
+                function_delta = tool_delta.get('function') or {}
+                if function_delta.get('name'):
+                    partial['name'] += function_delta['name']
+                if function_delta.get('arguments'):
+                    partial['arguments'].append(function_delta['arguments'])
+
+        if pending:
+            yield "".join(pending)
+
+        for index in sorted(partial_tool_calls):
+            complete_tool_calls.append(_partial_to_tool_call(partial_tool_calls[index]))
+
+        response = {
+            'choices': [{
+                'message': {
+                    'content': "".join(content_parts),
+                    'tool_calls': complete_tool_calls
+                }
+            }]
+        }
+        if prestarted:
+            response['prestarted_tool_results'] = prestarted
+        return response
+
+    def _prestart_tool_call(self, tool_call: Dict[str, Any], prestarted: Dict[tuple, Future]) -> None:
+        """
+        Start a tool call that finished streaming while the rest of the response still arrives.
+
+        Only idempotent tools are started early: if the final response differs, the
+        result is simply discarded without side effects.
+        """
+        tool_name = tool_call['function']['name']
+        tool_fn = self.tool_mapping.get(tool_name)
+        if not tool_call['id'] or tool_fn is None or tool_name not in self._idempotent_tools:
+            return
+        try:
+            tool_args = self._parse_tool_arguments(tool_call['function']['arguments'])
+        except ValueError:
+            return
+        prestarted[_tool_call_key(tool_call)] = self._get_tool_executor().submit(
+            self.handle_normalized_tool_call, tool_call, tool_args
+        )
     
     def handle_tool_call(self, tool_call):
         """Handle a tool call and return the result message"""
         try:
             normalized_tool_call = self._normalize_tool_call(tool_call)
-            if not normalized_tool_call:
-                raise ValueError("Malformed tool call payload")
+        except Exception:
+            normalized_tool_call = None
+
+        if not normalized_tool_call:
+            return {
+                "role": "tool",
+                "tool_call_id": 'unknown',
+                "name": 'unknown',
+                "content": dumps({"error": "Tool execution failed: Malformed tool call payload"})
+            }
+
+        return self.handle_normalized_tool_call(normalized_tool_call)
 
-            tool_name = normalized_tool_call['function']['name']
-            tool_args = self._parse_tool_arguments(normalized_tool_call['function'].get('arguments'))
-            tool_call_id = normalized_tool_call['id']
+    def handle_normalized_tool_call(
+        self,
+        tool_call: Dict[str, Any],
+        tool_args: Optional[Dict[str, Any]] = None,
+        parse_error: Optional[Exception] = None,
+    ):
+        """
+        Handle a tool call already produced by _normalize_tool_call and return the result message.
+
+        Pass tool_args when the arguments were parsed beforehand to skip parsing them again,
+        or parse_error when that parse failed, so the failure is reported without reparsing.
+        """
+        tool_name = tool_call['function']['name']
+        tool_call_id = tool_call['id']
+        try:
+            if parse_error is not None:
+                raise parse_error
+            if tool_args is None:
+                tool_args = self._parse_tool_arguments(tool_call['function'].get('arguments'))
             
-            # Call appropriate tool from tool_mapping
-            if tool_name in self.tool_mapping:
-                tool_result = self.tool_mapping[tool_name](**tool_args)
+            # Call appropriate tool from tool_mapping (resolved with a single lookup)
+            tool_fn = self.tool_mapping.get(tool_name)
+            if tool_fn is not None:
+                tool_result = self._execute_tool(tool_name, tool_fn, tool_args)
             else:
                 tool_result = {"error": f"Unknown tool: {tool_name}"}
             
@@ -185,34 +491,165 @@ class AIAgent:
                 "role": "tool",
                 "tool_call_id": tool_call_id,
                 "name": tool_name,
-                "content": json.dumps(tool_result, default=str)
+                "content": dumps(tool_result)
             }
         
         except Exception as e:
-            # Handle error case with null-safe extraction
-            try:
-                normalized_tool_call = self._normalize_tool_call(tool_call) if tool_call else None
-                tool_call_id = normalized_tool_call.get('id', 'unknown') if normalized_tool_call else 'unknown'
-                tool_name = normalized_tool_call.get('function', {}).get('name', 'unknown') if normalized_tool_call else 'unknown'
-            except Exception:
-                tool_call_id = 'unknown'
-                tool_name = 'unknown'
-            
             return {
                 "role": "tool",
                 "tool_call_id": tool_call_id,
                 "name": tool_name,
-                "content": json.dumps({"error": f"Tool execution failed: {str(e)}"})
+                "content": dumps({"error": f"Tool execution failed: {str(e)}"})
             }
     
+    def _execute_tool(self, tool_name: str, tool_fn: Callable[..., Any], tool_args: Dict[str, Any]) -> Any:
+        """Invoke a tool, reusing an earlier result of the same idempotent call in this run."""
+        if tool_name not in self._idempotent_tools:
+            return tool_fn(**tool_args)
+
+        cache_key = (tool_name, dumps(tool_args, sort_keys=True))
+        cached = self._tool_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        tool_result = tool_fn(**tool_args)
+        # Failures may be transient, so only successful results are reused.
+        first_item = tool_result[0] if isinstance(tool_result, list) and tool_result else None
+        failed = any(isinstance(item, dict) and 'error' in item for item in (tool_result, first_item))
+        if not failed:
+            self._tool_cache[cache_key] = tool_result
+        return tool_result
+
+    def _execute_tool_calls(self, prepared_calls: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Execute (tool_call, tool_args, parse_error) entries; results keep call order.
+
+        Consecutive idempotent calls run concurrently. Any other call waits for the calls
+        before it and finishes before later ones start, so stateful tools (e.g. a
+        write_file followed by read_file) keep the model's order.
+        """
+        results = []
+        batch = []
+        for prepared in prepared_calls:
+            if prepared[0]['function']['name'] in self._idempotent_tools:
+                batch.append(prepared)
+                continue
+            results.extend(self._execute_concurrently(batch))
+            batch = []
+            results.append(self.handle_normalized_tool_call(*prepared))
+        results.extend(self._execute_concurrently(batch))
+        return results
+
+    def _execute_concurrently(self, prepared_calls: List[tuple]) -> List[Dict[str, Any]]:
+        """Run independent prepared calls on the tool pool; results keep call order."""
+        if len(prepared_calls) <= 1:
+            return [self.handle_normalized_tool_call(*prepared) for prepared in prepared_calls]
+
+        executor = self._get_tool_executor()
+        return list(executor.map(self.handle_normalized_tool_call, *zip(*prepared_calls)))
+
+    def _get_tool_executor(self) -> ThreadPoolExecutor:
+        """Return the agent's tool worker pool, creating it on first use."""
+        # Kept for the agent's lifetime to avoid per-turn thread spin-up.
+        executor = self._tool_executor
+        if executor is None:
+            executor = self._tool_executor = ThreadPoolExecutor(
+                max_workers=_MAX_TOOL_WORKERS, thread_name_prefix="agent-tool"
+            )
+        return executor
+
+    def _response_cache_key(self, user_input: str) -> Optional[str]:
+        """Key for the response cache, or None when agent.response_cache is disabled."""
+        if not self.config.get('agent', {}).get('response_cache', False):
+            return None
+        key_source = "\x1f".join((
+            str(self.provider_info.get('model')),
+            str(self.config.get('system_prompt', '')),
+            user_input,
+            _config_fingerprint(self.config),
+        ))
+        return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+
+    def _lookup_response(self, cache_key: Optional[str]) -> Optional[str]:
+        """Return a still-fresh cached response for cache_key, if any."""
+        if cache_key is None:
+            return None
+        ttl = float(self.config.get('agent', {}).get('response_cache_ttl', 3600))
+        return _get_cached_response(cache_key, ttl)
+
+    def _remember_response(self, cache_key: Optional[str], response: str) -> None:
+        """Store a final response under cache_key when caching is enabled."""
+        # The "no meaningful response" apology is never worth replaying.
+        if cache_key is None or response == _NO_RESPONSE_MESSAGE:
+            return
+        max_entries = int(self.config.get('agent', {}).get('response_cache_size', 1024))
+        _store_cached_response(cache_key, response, max_entries)
+
     def run(self, user_input: str):
         """Run the agent with user input and return FULL conversation content"""
-        # Initialize messages with system prompt and user input
+        cache_key = self._response_cache_key(user_input)
+        cached = self._lookup_response(cache_key)
+        if cached is not None:
+            return cached
+
+        loop = self._agent_loop(user_input)
+        try:
+            messages = next(loop)
+            while True:
+                messages = loop.send(self.call_llm(messages))
+        except StopIteration as stop:
+            self._remember_response(cache_key, stop.value)
+            return stop.value
+
+    async def arun(self, user_input: str) -> str:
+        """
+        Asynchronous run(), for fanning out many agents on one event loop.
+
+        LLM calls are awaited; tool turns are advanced in the default executor so
+        blocking tools do not stall other agents sharing the loop.
+        """
+        cache_key = self._response_cache_key(user_input)
+        cached = self._lookup_response(cache_key)
+        if cached is not None:
+            return cached
+
+        event_loop = asyncio.get_running_loop()
+        agent_loop = self._agent_loop(user_input)
+        finished, value = await event_loop.run_in_executor(None, _advance_loop, agent_loop, None)
+        while not finished:
+            response = await self.acall_llm(value)
+            finished, value = await event_loop.run_in_executor(None, _advance_loop, agent_loop, response)
+        self._remember_response(cache_key, value)
+        return value
+
+    def run_stream(self, user_input: str):
+        """
+        Run the agent while streaming assistant text as it is generated.
+
+        Yields content fragments in small batches; the generator's return value is
+        the same final response run() would return.
+        """
+        loop = self._agent_loop(user_input)
+        try:
+            messages = next(loop)
+            while True:
+                response = yield from self._collect_stream(self.call_llm(messages, stream=True))
+                messages = loop.send(response)
+        except StopIteration as stop:
+            return stop.value
+
+    def _agent_loop(self, user_input: str):
+        """
+        Agentic loop shared by run() and run_stream().
+
+        Yields the message list whenever an LLM response is needed and expects the
+        response to be sent back; returns the final response text.
+        """
+        self._tool_cache = {}
+
+        # Initialize messages with the shared system message and the user input
         messages = [
-            {
-                "role": "system",
-                "content": self.config['system_prompt']
-            },
+            self._system_message,
             {
                 "role": "user",
                 "content": user_input
@@ -224,21 +661,27 @@ class AIAgent:
         non_completion_tool_calls = 0
         no_tool_streak = 0
         completion_message_fallback: Optional[str] = None
-        finalize_after_no_tool_streak = int(
-            self.config.get('agent', {}).get('finalize_after_no_tool_streak', 2)
-        )
+        agent_config = self.config.get('agent', {})
+        finalize_after_no_tool_streak = max(1, int(agent_config.get('finalize_after_no_tool_streak', 2)))
+
+        # Bound once for the loop below; these are looked up on every iteration otherwise.
+        silent = self.silent
+        normalize_tool_calls = self._normalize_tool_calls
+        parse_tool_arguments = self._parse_tool_arguments
+        messages_append = messages.append
+        content_append = full_response_content.append
         
         # Implement agentic loop
-        max_iterations = self.config.get('agent', {}).get('max_iterations', 10)
+        max_iterations = agent_config.get('max_iterations', 10)
         iteration = 0
         
         while iteration < max_iterations:
             iteration += 1
-            if not self.silent:
+            if not silent:
                 print(f"🔄 Agent iteration {iteration}/{max_iterations}")
             
-            # Call LLM
-            response = self.call_llm(messages)
+            # Call LLM (performed by the driver: run() or run_stream())
+            response = yield messages
             
             # Add the response to messages
             assistant_message = (
@@ -247,16 +690,19 @@ class AIAgent:
             )
 
             raw_content = assistant_message.get('content', '')
-            if raw_content is None:
+            # Plain strings are what providers return on virtually every turn; check them first.
+            if type(raw_content) is str:
+                content = raw_content
+            elif raw_content is None:
                 content = ''
             elif isinstance(raw_content, (list, dict)):
-                content = json.dumps(raw_content, default=str)
-            elif isinstance(raw_content, str):
-                content = raw_content
+                content = dumps(raw_content)
             else:
                 content = str(raw_content)
 
-            tool_calls = self._normalize_tool_calls(assistant_message.get('tool_calls'))
+            tool_calls = normalize_tool_calls(assistant_message.get('tool_calls'))
+            # Results of calls run_stream() already started while the response was streaming
+            prestarted = response.get('prestarted_tool_results') if isinstance(response, dict) else None
 
             assistant_message_payload = {"role": "assistant"}
             # Keep content present for assistant messages to maximize provider compatibility.
@@ -264,24 +710,44 @@ class AIAgent:
             if tool_calls:
                 assistant_message_payload["tool_calls"] = tool_calls
 
-            messages.append(assistant_message_payload)
+            messages_append(assistant_message_payload)
             
             # Capture assistant content for full response
             # Only add non-empty content
-            if content and content.strip():
-                full_response_content.append(content.strip())
+            stripped_content = content.strip()
+            if stripped_content:
+                content_append(stripped_content)
             
             # Check if there are tool calls
             if tool_calls:
                 no_tool_streak = 0
-                if not self.silent:
+                if not silent:
                     print(f"🔧 Agent making {len(tool_calls)} tool call(s)")
                 
                 task_completed = False
+                # Tool result messages in tool_calls order; regular tools are filled in after they run.
+                tool_messages: List[Optional[Dict[str, Any]]] = []
+                deferred_calls = []
+                prestarted_slots = []
                 for tool_call in tool_calls:
                     tool_name = tool_call['function']['name']
+                    prestarted_result = prestarted.pop(_tool_call_key(tool_call), None) if prestarted else None
+                    if prestarted_result is not None:
+                        prestarted_slots.append((len(tool_messages), prestarted_result))
+                        tool_messages.append(None)
+                        non_completion_tool_calls += 1
+                        if not silent:
+                            print(f"   📞 Calling tool: {tool_name}")
+                        continue
+
+                    # Parse arguments once; a parse failure is kept and reported as the tool result.
+                    try:
+                        tool_args = parse_tool_arguments(tool_call['function'].get('arguments'))
+                        parse_error = None
+                    except ValueError as exc:
+                        tool_args, parse_error = None, exc
                     
-                    if not self.silent:
+                    if not silent:
                         print(f"   📞 Calling tool: {tool_name}")
                     
                     # Special handling for mark_task_complete to extract completion message
@@ -290,34 +756,36 @@ class AIAgent:
                         has_meaningful_content = len(full_response_content) > 0 or non_completion_tool_calls > 0
                         
                         if not has_meaningful_content:
-                            if not self.silent:
+                            if not silent:
                                 print("⚠️ Task completion called too early - continuing work")
                             continue
                         
                         # Execute completion tool and end loop with accumulated assistant content.
-                        tool_result = self.handle_tool_call(tool_call)
-                        messages.append(tool_result)
-                        try:
-                            tool_args = self._parse_tool_arguments(tool_call['function'].get('arguments'))
-                        except Exception:
-                            tool_args = {}
-                        completion_message = tool_args.get('completion_message')
+                        tool_messages.append(self.handle_normalized_tool_call(tool_call, tool_args, parse_error))
+                        completion_message = (tool_args or {}).get('completion_message')
                         if completion_message is not None:
                             if not isinstance(completion_message, str):
-                                completion_message = json.dumps(completion_message, default=str)
+                                completion_message = dumps(completion_message)
                             completion_message = completion_message.strip()
                             if completion_message:
                                 completion_message_fallback = completion_message
                         task_completed = True
                         
-                        if not self.silent:
+                        if not silent:
                             print("✅ Task completion tool called - exiting loop")
                         continue
                     
-                    # Handle other tools normally
-                    tool_result = self.handle_tool_call(tool_call)
-                    messages.append(tool_result)
+                    # Other tools run below; only consecutive idempotent calls overlap.
+                    deferred_calls.append((len(tool_messages), (tool_call, tool_args, parse_error)))
+                    tool_messages.append(None)
                     non_completion_tool_calls += 1
+
+                deferred_results = self._execute_tool_calls([prepared for _, prepared in deferred_calls])
+                for (slot, _), tool_result in zip(deferred_calls, deferred_results):
+                    tool_messages[slot] = tool_result
+                for slot, future in prestarted_slots:
+                    tool_messages[slot] = future.result()
+                messages.extend(tool_messages)
                 
                 if task_completed:
                     finalized = self._finalize_response_content(full_response_content)
@@ -328,20 +796,20 @@ class AIAgent:
                     return "Task completed successfully."
             else:
                 no_tool_streak += 1
-                if not self.silent:
+                if not silent:
                     print("💭 Agent responded without tool calls - continuing loop")
 
                 # If the model repeatedly responds directly without tools, finalize gracefully.
-                if no_tool_streak >= max(1, finalize_after_no_tool_streak):
+                if no_tool_streak >= finalize_after_no_tool_streak:
                     finalized = self._finalize_response_content(full_response_content)
                     if finalized:
                         return finalized
         
         # If max iterations reached, return whatever content we gathered
         if full_response_content:
-            string_content = [str(item) if not isinstance(item, str) else item for item in full_response_content]
-            return self._finalize_response_content(string_content)
+            # Every entry was appended as a stripped str above, so no coercion pass is needed.
+            return self._finalize_response_content(full_response_content)
         elif completion_message_fallback:
             return completion_message_fallback
         else:
-            return "I apologize, but I couldn't generate a meaningful response. Please try rephrasing your question."
+            return _NO_RESPONSE_MESSAGE
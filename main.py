@@ -1,4 +1,5 @@
 import argparse
+import atexit
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -6,10 +7,14 @@ import re
 import shutil
 import sys
 import textwrap
+import time
+from typing import Optional, TextIO
 from providers import ProviderFactory
 
 
 class CLIStyle:
+    __slots__ = ("enabled", "use_unicode", "_box_chars")
+
     RESET = "\033[0m"
     BOLD = "\033[1m"
     DIM = "\033[2m"
@@ -21,9 +26,27 @@ class CLIStyle:
     GRAY = "\033[38;5;246m"
     TEAL = "\033[38;5;44m"
 
+    UNICODE_BOX_CHARS = {
+        "h": "═",
+        "v": "║",
+        "tl": "╔",
+        "tr": "╗",
+        "bl": "╚",
+        "br": "╝",
+    }
+    ASCII_BOX_CHARS = {
+        "h": "-",
+        "v": "|",
+        "tl": "+",
+        "tr": "+",
+        "bl": "+",
+        "br": "+",
+    }
+
     def __init__(self, enabled: bool):
         self.enabled = enabled
         self.use_unicode = "utf" in (sys.stdout.encoding or "").lower()
+        self._box_chars = self.UNICODE_BOX_CHARS if self.use_unicode else self.ASCII_BOX_CHARS
 
     def color(self, text: str, *styles: str) -> str:
         if not self.enabled or not styles:
@@ -31,52 +54,56 @@ class CLIStyle:
         return f"{''.join(styles)}{text}{self.RESET}"
 
     def box_chars(self):
-        if self.use_unicode:
-            return {
-                "h": "═",
-                "v": "║",
-                "tl": "╔",
-                "tr": "╗",
-                "bl": "╚",
-                "br": "╝",
-            }
-        return {
-            "h": "-",
-            "v": "|",
-            "tl": "+",
-            "tr": "+",
-            "bl": "+",
-            "br": "+",
-        }
-
-
-ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+        # Shared, read-only mapping chosen once per style.
+        return self._box_chars
+
+
+ANSI_RE = re.compile(r"\x1b\[[0-9;]*m", re.ASCII)
 
 
 def strip_ansi(text: str) -> str:
+    # Most lines carry no escape codes; the substring check is far cheaper than a regex pass.
+    if "\x1b" not in text:
+        return text
     return ANSI_RE.sub("", text)
 
 
+# Terminal size is re-queried at most this often; resizes show up on the next render after it.
+TERMINAL_WIDTH_TTL = 0.5
+_terminal_width_cache = {}
+
+
 def terminal_width(default: int = 100) -> int:
+    now = time.monotonic()
+    cached = _terminal_width_cache.get(default)
+    if cached is not None and now - cached[0] < TERMINAL_WIDTH_TTL:
+        return cached[1]
     width = shutil.get_terminal_size((default, 24)).columns
-    return max(80, min(width, 140))
+    width = max(80, min(width, 140))
+    _terminal_width_cache[default] = (now, width)
+    return width
 
 
-def render_panel(style: CLIStyle, title: str, lines):
+def render_panel(style: CLIStyle, title: str, lines, width: Optional[int] = None):
     chars = style.box_chars()
-    width = terminal_width()
+    if width is None:
+        width = terminal_width()
     inner_width = width - 4
 
     title_text = f" {title} "
     top_core = title_text + chars["h"] * max(0, inner_width - len(strip_ansi(title_text)))
-    print(style.color(chars["tl"] + top_core + chars["tr"], CLIStyle.BLUE))
+    # The whole panel is assembled first and written in one call.
+    parts = [style.color(chars["tl"] + top_core + chars["tr"], CLIStyle.BLUE)]
 
+    border = style.color(chars["v"], CLIStyle.BLUE)
     for line in lines:
         visible = len(strip_ansi(line))
         padded = line + (" " * max(0, inner_width - visible))
-        print(style.color(chars["v"], CLIStyle.BLUE) + " " + padded + " " + style.color(chars["v"], CLIStyle.BLUE))
+        parts.append(border + " " + padded + " " + border)
 
-    print(style.color(chars["bl"] + (chars["h"] * inner_width) + chars["br"], CLIStyle.BLUE))
+    parts.append(style.color(chars["bl"] + (chars["h"] * inner_width) + chars["br"], CLIStyle.BLUE))
+    sys.stdout.write("\n".join(parts) + "\n")
+    sys.stdout.flush()
 
 
 def render_banner(style: CLIStyle):
@@ -92,28 +119,31 @@ def render_banner(style: CLIStyle):
     render_panel(style, "Launch", lines)
 
 
+BULLET_RE = re.compile(r"^(\s*(?:[-*]|\d+\.)\s+)(.*)$")
+
+
 def wrap_response_text(text: str, width: int):
     wrapped_lines = []
+    extend = wrapped_lines.extend
+    # One wrapper per kind, reconfigured per paragraph instead of rebuilt by textwrap.fill().
+    plain_wrapper = textwrap.TextWrapper(width=width)
+    bullet_wrapper = textwrap.TextWrapper()
     for paragraph in (text or "").splitlines():
         raw = paragraph.rstrip()
         if not raw:
             wrapped_lines.append("")
             continue
 
-        bullet_match = re.match(r"^(\s*(?:[-*]|\d+\.)\s+)(.*)$", raw)
+        bullet_match = BULLET_RE.match(raw)
         if bullet_match:
             prefix = bullet_match.group(1)
             body = bullet_match.group(2).strip()
-            fill = textwrap.fill(
-                body,
-                width=max(40, width - len(prefix)),
-                initial_indent=prefix,
-                subsequent_indent=" " * len(prefix),
-            )
-            wrapped_lines.extend(fill.splitlines())
+            bullet_wrapper.width = max(40, width - len(prefix))
+            bullet_wrapper.initial_indent = prefix
+            bullet_wrapper.subsequent_indent = " " * len(prefix)
+            extend(bullet_wrapper.wrap(body))
         else:
-            fill = textwrap.fill(raw, width=width)
-            wrapped_lines.extend(fill.splitlines())
+            extend(plain_wrapper.wrap(raw))
     return wrapped_lines
 
 
@@ -136,7 +166,7 @@ def create_session_log(provider_info: dict) -> Path:
     return path
 
 
-def append_exchange_to_log(log_path: Path, user_input: str, response: str):
+def append_exchange_to_log(log_file: TextIO, user_input: str, response: str):
     ts = datetime.now().isoformat(timespec="seconds")
     section = [
         f"## Exchange {ts}",
@@ -152,8 +182,9 @@ def append_exchange_to_log(log_path: Path, user_input: str, response: str):
         "---",
         "",
     ]
-    with log_path.open("a", encoding="utf-8") as f:
-        f.write("\n".join(section))
+    # The handle stays open for the session; flushing keeps each exchange on disk if the process dies.
+    log_file.write("\n".join(section))
+    log_file.flush()
 
 
 def show_provider_list(style: CLIStyle):
@@ -200,6 +231,8 @@ def main():
         agent = AIAgent(provider_name=args.provider, silent=not args.verbose)
         provider_info = agent.provider_info
         session_log_path = create_session_log(provider_info)
+        session_log = session_log_path.open("a", encoding="utf-8", buffering=8192)
+        atexit.register(session_log.close)
 
         render_banner(style)
         intro_lines = [
@@ -244,12 +277,14 @@ def main():
 
             print(style.color("Assistant is analyzing...", CLIStyle.DIM, CLIStyle.BLUE))
             response = agent.run(user_input)
-            append_exchange_to_log(session_log_path, user_input, response)
+            append_exchange_to_log(session_log, user_input, response)
 
-            response_lines = wrap_response_text(response, width=terminal_width() - 8)
+            # Measure once so wrapping and the panel agree on the same width.
+            width = terminal_width()
+            response_lines = wrap_response_text(response, width=width - 8)
             if not response_lines:
                 response_lines = [style.color("No response generated.", CLIStyle.RED)]
-            render_panel(style, "Assistant Response", response_lines)
+            render_panel(style, "Assistant Response", response_lines, width=width)
 
         except KeyboardInterrupt:
             print("\n" + style.color("Session interrupted.", CLIStyle.DIM, CLIStyle.GRAY))
@@ -258,6 +293,8 @@ def main():
             print(style.color(f"Error: {e}", CLIStyle.BOLD, CLIStyle.RED))
             print("Please try again or type 'quit' to exit.")
 
+    session_log.close()
+
 
 if __name__ == "__main__":
     main()
@@ -1,17 +1,33 @@
 import argparse
+import atexit
 from datetime import datetime
+import functools
 import logging
 import os
 from pathlib import Path
 import re
 import shutil
+import signal
 import sys
 import textwrap
 import threading
 import time
+from typing import Optional, TextIO
 from providers import ProviderFactory
 
 
+@functools.lru_cache(maxsize=64)
+def combine_sgr(styles) -> str:
+    # Merge e.g. BOLD + GOLD into one "\033[1;38;5;220m" sequence instead of two back to back.
+    params = []
+    for code in styles:
+        if code.startswith("\033[") and code.endswith("m"):
+            params.append(code[2:-1])
+        else:
+            return "".join(styles)
+    return f"\033[{';'.join(params)}m"
+
+
 class CLIStyle:
     RESET = "\033[0m"
     BOLD = "\033[1m"
@@ -25,14 +41,20 @@ class CLIStyle:
     TEAL = "\033[38;5;44m"
     ORANGE = "\033[38;5;208m"
 
-    def __init__(self, enabled: bool):
+    def __init__(self, enabled: bool, use_unicode: Optional[bool] = None):
         self.enabled = enabled
-        self.use_unicode = "utf" in (sys.stdout.encoding or "").lower()
+        if use_unicode is None:
+            use_unicode = "utf" in (sys.stdout.encoding or "").lower()
+        self.use_unicode = use_unicode
 
     def color(self, text: str, *styles: str) -> str:
         if not self.enabled or not styles:
             return text
-        return f"{''.join(styles)}{text}{self.RESET}"
+        return f"{combine_sgr(styles)}{text}{self.RESET}"
+
+    def color_measured(self, text: str, *styles: str):
+        # (colored text, visible length) so render_panel does not have to rescan the result.
+        return self.color(text, *styles), len(text)
 
     def box_chars(self):
         if self.use_unicode:
@@ -54,97 +76,201 @@ class CLIStyle:
         }
 
 
-ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+ANSI_RE = re.compile(r"\x1b\[[0-9;]*m", re.ASCII)
+
+
+def ansi_visible_len(text: str) -> int:
+    # Length of text without its SGR escape sequences, counted without building a stripped copy.
+    start = text.find("\x1b")
+    if start < 0:
+        return len(text)
+    # Jump between escape sequences and count the plain runs in between.
+    length = 0
+    pos = 0
+    while start >= 0:
+        match = ANSI_RE.match(text, start)
+        if match is None:
+            start = text.find("\x1b", start + 1)
+            continue
+        length += start - pos
+        pos = match.end()
+        start = text.find("\x1b", pos)
+    return length + len(text) - pos
+
+
+# Measured sizes per default width, as (measured_at, os.terminal_size). Cleared on SIGWINCH
+# where available; elsewhere an entry is trusted for TERMINAL_WIDTH_TTL seconds.
+TERMINAL_WIDTH_TTL = 0.5
+_terminal_width_cache = {}
+_resize_signal_installed = False
+
+
+def watch_terminal_resize():
+    global _resize_signal_installed
+    if _resize_signal_installed or not hasattr(signal, "SIGWINCH"):
+        return
+    previous = signal.getsignal(signal.SIGWINCH)
+
+    def on_resize(signum, frame):
+        _terminal_width_cache.clear()
+        if callable(previous):
+            previous(signum, frame)
+
+    try:
+        signal.signal(signal.SIGWINCH, on_resize)
+    except ValueError:
+        # Handlers can only be installed from the main thread; keep the TTL fallback.
+        return
+    _resize_signal_installed = True
 
 
-def strip_ansi(text: str) -> str:
-    return ANSI_RE.sub("", text)
+def _terminal_size(default: int):
+    cached = _terminal_width_cache.get(default)
+    if cached is not None:
+        if _resize_signal_installed or time.monotonic() - cached[0] < TERMINAL_WIDTH_TTL:
+            return cached[1]
+    size = shutil.get_terminal_size((default, 24))
+    _terminal_width_cache[default] = (time.monotonic(), size)
+    return size
 
 
 def terminal_width(default: int = 100) -> int:
-    width = shutil.get_terminal_size((default, 24)).columns
-    return max(80, min(width, 160))
+    return max(80, min(_terminal_size(default).columns, 160))
+
+
+CURSOR_HOME = "\x1b[H"
+CLEAR_SCREEN = CURSOR_HOME + "\x1b[2J"
+ROW_END = "\x1b[K\n"
+ERASE_BELOW = "\x1b[J"
+
+
+@functools.lru_cache(maxsize=None)
+def _style_for(enabled: bool, use_unicode: bool) -> CLIStyle:
+    # Cached renderers are keyed on the style flags, not on caller-owned CLIStyle objects.
+    return CLIStyle(enabled, use_unicode)
+
 
+def panel_borders(style: CLIStyle, title: str, width: int):
+    # (top, bottom, row start, row end) strings; identical for every redraw at the same width.
+    return _panel_borders(style.enabled, style.use_unicode, title, width)
 
-def render_panel(style: CLIStyle, title: str, lines):
+
+@functools.lru_cache(maxsize=64)
+def _panel_borders(enabled: bool, use_unicode: bool, title: str, width: int):
+    style = _style_for(enabled, use_unicode)
     chars = style.box_chars()
-    width = terminal_width()
     inner_width = width - 4
-
     title_text = f" {title} "
-    top_core = title_text + chars["h"] * max(0, inner_width - len(strip_ansi(title_text)))
-    print(style.color(chars["tl"] + top_core + chars["tr"], CLIStyle.BLUE))
+    top_core = title_text + chars["h"] * max(0, inner_width - ansi_visible_len(title_text))
+    top = style.color(chars["tl"] + top_core + chars["tr"], CLIStyle.BLUE)
+    bottom = style.color(chars["bl"] + (chars["h"] * inner_width) + chars["br"], CLIStyle.BLUE)
+    border = style.color(chars["v"], CLIStyle.BLUE)
+    return top, bottom, border + " ", " " + border
 
-    for line in lines:
-        visible = len(strip_ansi(line))
-        padded = line + (" " * max(0, inner_width - visible))
-        print(style.color(chars["v"], CLIStyle.BLUE) + " " + padded + " " + style.color(chars["v"], CLIStyle.BLUE))
 
-    print(style.color(chars["bl"] + (chars["h"] * inner_width) + chars["br"], CLIStyle.BLUE))
+def render_panel(style: CLIStyle, title: str, lines, out=None):
+    # Lines are plain strings or (text, visible_len) pairs whose width is already known.
+    # With `out`, rendered rows are appended to that list so a caller can emit a whole frame at once.
+    width = terminal_width()
+    inner_width = width - 4
+    top, bottom, row_start, row_end = panel_borders(style, title, width)
+
+    rows = [top]
+    for line in lines:
+        if type(line) is tuple:
+            line, visible = line
+        else:
+            visible = ansi_visible_len(line)
+        # ljust pads in C; the target length accounts for invisible escape bytes in the line.
+        line = line.ljust(inner_width + len(line) - visible)
+        rows.append(row_start + line + row_end)
+
+    rows.append(bottom)
+    if out is not None:
+        out.extend(rows)
+        return
+    sys.stdout.write("\n".join(rows) + "\n")
+    sys.stdout.flush()
 
 
 def wrap_response_text(text: str, width: int):
+    width = max(40, width)
+    # One wrapper for all paragraphs; without hyphen splitting TextWrapper uses its simpler word regex.
+    wrapper = textwrap.TextWrapper(width=width, break_on_hyphens=False)
     wrapped_lines = []
     for paragraph in (text or "").splitlines():
         raw = paragraph.rstrip()
         if not raw:
             wrapped_lines.append("")
-            continue
-        fill = textwrap.fill(raw, width=max(40, width))
-        wrapped_lines.extend(fill.splitlines())
+        elif len(raw) <= width and "\t" not in raw:
+            # Already fits: the wrapper would return the line unchanged.
+            wrapped_lines.append(raw)
+        else:
+            wrapped_lines.extend(wrapper.wrap(raw))
     return wrapped_lines
 
 
+SESSION_LOG_HEADER = (
+    "# Make It Heavy Orchestrator Session\n"
+    "\n"
+    "- Started: {started}\n"
+    "- Provider: {provider}\n"
+    "- Model: {model}\n"
+    "\n"
+    "---\n"
+)
+EXCHANGE_LOG_ENTRY = (
+    "## Exchange {timestamp}\n"
+    "\n"
+    "### User\n"
+    "\n"
+    "{user_input}\n"
+    "\n"
+    "### Final Response\n"
+    "\n"
+    "{response}\n"
+    "\n"
+    "---\n"
+)
+
+
 def create_session_log(provider_info: dict) -> Path:
     logs_dir = Path("logs")
     logs_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     path = logs_dir / f"heavy_session_{timestamp}.md"
-    header = [
-        "# Make It Heavy Orchestrator Session",
-        "",
-        f"- Started: {datetime.now().isoformat(timespec='seconds')}",
-        f"- Provider: {provider_info.get('display_name', 'unknown')}",
-        f"- Model: {provider_info.get('model', 'unknown')}",
-        "",
-        "---",
-        "",
-    ]
-    path.write_text("\n".join(header), encoding="utf-8")
+    header = SESSION_LOG_HEADER.format(
+        started=datetime.now().isoformat(timespec="seconds"),
+        provider=provider_info.get("display_name", "unknown"),
+        model=provider_info.get("model", "unknown"),
+    )
+    path.write_text(header, encoding="utf-8")
     return path
 
 
-def append_exchange_to_log(log_path: Path, user_input: str, response: str):
-    ts = datetime.now().isoformat(timespec="seconds")
-    section = [
-        f"## Exchange {ts}",
-        "",
-        "### User",
-        "",
-        user_input.strip(),
-        "",
-        "### Final Response",
-        "",
-        response.strip(),
-        "",
-        "---",
-        "",
-    ]
-    with log_path.open("a", encoding="utf-8") as f:
-        f.write("\n".join(section))
+def append_exchange_to_log(log_file: TextIO, user_input: str, response: str):
+    section = EXCHANGE_LOG_ENTRY.format(
+        timestamp=datetime.now().isoformat(timespec="seconds"),
+        user_input=user_input.strip(),
+        response=response.strip(),
+    )
+    # Heavy runs take minutes, so each result is flushed rather than left in the buffer.
+    log_file.write(section)
+    log_file.flush()
+
+
+# Any of these in a result means the run failed and should not be logged as an answer.
+FAILURE_MARKERS_RE = re.compile(
+    r"all agents failed to provide meaningful results|error:|timed out|task failed",
+    re.IGNORECASE,
+)
 
 
 def should_log_successful_result(result: str) -> bool:
-    if not result or not result.strip():
+    if not result or result.isspace():
         return False
-    normalized = result.strip().lower()
-    failure_markers = [
-        "all agents failed to provide meaningful results",
-        "error:",
-        "timed out",
-        "task failed",
-    ]
-    return not any(marker in normalized for marker in failure_markers)
+    # One case-insensitive scan instead of lower-casing a copy and searching it four times.
+    return FAILURE_MARKERS_RE.search(result) is None
 
 
 def show_provider_list(style: CLIStyle):
@@ -158,24 +284,87 @@ def show_provider_list(style: CLIStyle):
     render_panel(style, "Providers", lines[:-1] if lines and lines[-1] == "" else lines)
 
 
+def build_progress_bar(style: CLIStyle, status: str, width: int) -> str:
+    # Bars only change on status transitions or resizes, so redraws are mostly cache hits.
+    return _progress_bar(style.enabled, style.use_unicode, status, width)
+
+
+@functools.lru_cache(maxsize=256)
+def _progress_bar(enabled: bool, use_unicode: bool, status: str, width: int) -> str:
+    style = _style_for(enabled, use_unicode)
+    status_upper = (status or "").upper()
+    if status_upper == "COMPLETED":
+        fill = width
+        color = CLIStyle.GREEN
+        marker = "■"
+    elif "FAILED" in status_upper or "ERROR" in status_upper:
+        fill = width
+        color = CLIStyle.RED
+        marker = "■"
+    elif "RETRY" in status_upper:
+        fill = max(3, width // 3)
+        color = CLIStyle.ORANGE
+        marker = "▣"
+    elif status_upper == "PROCESSING...":
+        fill = max(4, width // 2)
+        color = CLIStyle.CYAN
+        marker = "▣"
+    elif status_upper == "TIMEOUT":
+        fill = width
+        color = CLIStyle.RED
+        marker = "■"
+    elif status_upper == "SKIPPED":
+        fill = width
+        color = CLIStyle.GRAY
+        marker = "■"
+    else:
+        fill = 0
+        color = CLIStyle.GRAY
+        marker = "·"
+
+    if style.use_unicode:
+        bar = marker * fill + "·" * max(0, width - fill)
+    else:
+        bar = "#" * fill + "." * max(0, width - fill)
+    return style.color(bar, color)
+
+
 class OrchestratorCLI:
     def __init__(self, provider_name=None, verbose=False):
+        # Imported here on purpose: it pulls in yaml, the agent and tool dependencies, so
+        # --list-providers keeps working without them and main() can report a missing module.
         from orchestrator import TaskOrchestrator
 
         self.verbose = verbose
         self.style = CLIStyle(enabled=sys.stdout.isatty())
+        watch_terminal_resize()
 
         if not verbose:
             logging.getLogger("providers.groq_provider").setLevel(logging.CRITICAL)
 
         self.orchestrator = TaskOrchestrator(provider_name=provider_name, silent=not verbose)
         self.start_time = None
+        # (whole seconds, formatted text) of the last elapsed value shown
+        self._elapsed_text = (None, "")
         self.running = False
+        # Rows of the last progress frame on screen; None forces a full redraw.
+        # The monitor thread and run_task both draw, so frames are written under the lock.
+        self._last_frame = None
+        self._frame_lock = threading.Lock()
+        # Inputs of the last rendered frame; an unchanged snapshot skips the redraw
+        self._last_signature = None
 
         self.provider_info = self.orchestrator.provider.get_provider_info()
         self.session_log_path = create_session_log(self.provider_info)
+        self.session_log = self.session_log_path.open("a", encoding="utf-8", buffering=1 << 16)
+        atexit.register(self.session_log.close)
+        atexit.register(self.orchestrator.close)
 
     def clear_screen(self):
+        if self.style.enabled and os.name != "nt":
+            # Cursor home + erase display; avoids forking `clear` on every redraw.
+            sys.stdout.write(CLEAR_SCREEN)
+            return
         os.system("cls" if os.name == "nt" else "clear")
 
     def format_time(self, seconds):
@@ -189,48 +378,23 @@ class OrchestratorCLI:
         minutes = int((seconds % 3600) // 60)
         return f"{hours}h {minutes}m"
 
-    def create_progress_bar(self, status: str) -> str:
-        width = max(18, min(56, terminal_width() - 52))
-        status_upper = (status or "").upper()
-        if status_upper == "COMPLETED":
-            fill = width
-            color = CLIStyle.GREEN
-            marker = "■"
-        elif "FAILED" in status_upper or "ERROR" in status_upper:
-            fill = width
-            color = CLIStyle.RED
-            marker = "■"
-        elif "RETRY" in status_upper:
-            fill = max(3, width // 3)
-            color = CLIStyle.ORANGE
-            marker = "▣"
-        elif status_upper == "PROCESSING...":
-            fill = max(4, width // 2)
-            color = CLIStyle.CYAN
-            marker = "▣"
-        elif status_upper == "TIMEOUT":
-            fill = width
-            color = CLIStyle.RED
-            marker = "■"
-        else:
-            fill = 0
-            color = CLIStyle.GRAY
-            marker = "·"
-
-        if self.style.use_unicode:
-            bar = marker * fill + "·" * max(0, width - fill)
-        else:
-            bar = "#" * fill + "." * max(0, width - fill)
-        return self.style.color(bar, color)
-
     def update_display(self, force=False):
         if not self.running and not force:
             return
 
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed = int(time.monotonic() - self.start_time) if self.start_time else 0
+        # Sub-second redraws reuse the string formatted for the current second.
+        if self._elapsed_text[0] != elapsed:
+            self._elapsed_text = (elapsed, self.format_time(elapsed))
         progress = self.orchestrator.get_progress_status()
+        synthesis_status = self.orchestrator.get_synthesis_status()
+
+        signature = (elapsed, self.running, terminal_width(), synthesis_status, tuple(sorted(progress.items())))
+        if signature == self._last_signature and not force:
+            return
+        self._last_signature = signature
 
-        self.clear_screen()
+        frame = []
         header_lines = [
             self.style.color("MAKE IT HEAVY ORCHESTRATOR", CLIStyle.BOLD, CLIStyle.GOLD),
             self.style.color("Parallel Multi-Agent Research", CLIStyle.DIM, CLIStyle.GRAY),
@@ -239,49 +403,97 @@ class OrchestratorCLI:
             f"{self.style.color('Model:', CLIStyle.BOLD, CLIStyle.CYAN)} {self.provider_info['model']}",
             f"{self.style.color('Agents:', CLIStyle.BOLD, CLIStyle.CYAN)} {self.orchestrator.num_agents} "
             f"(max concurrency {self.orchestrator.max_concurrency})",
-            f"{self.style.color('Elapsed:', CLIStyle.BOLD, CLIStyle.CYAN)} {self.format_time(elapsed)}",
+            f"{self.style.color('Elapsed:', CLIStyle.BOLD, CLIStyle.CYAN)} {self._elapsed_text[1]}",
             f"{self.style.color('State:', CLIStyle.BOLD, CLIStyle.CYAN)} "
             f"{'Running' if self.running else 'Completed'}",
         ]
-        render_panel(self.style, "Heavy Session", header_lines)
+        render_panel(self.style, "Heavy Session", header_lines, out=frame)
 
+        # Agent and synthesis rows are built with known visible widths (label + bar + status).
+        bar_width = max(18, min(56, terminal_width() - 52))
         agent_lines = []
         for i in range(self.orchestrator.num_agents):
             status = progress.get(i, "QUEUED")
-            bar = self.create_progress_bar(status)
-            agent_lines.append(
-                f"{self.style.color(f'Agent {i + 1:02d}', CLIStyle.BOLD, CLIStyle.CYAN)} "
-                f"{bar} "
-                f"{self.style.color(status, CLIStyle.DIM, CLIStyle.GRAY)}"
-            )
-        render_panel(self.style, "Agent Progress", agent_lines)
+            label, label_len = self.style.color_measured(f"Agent {i + 1:02d}", CLIStyle.BOLD, CLIStyle.CYAN)
+            status_text, status_len = self.style.color_measured(status, CLIStyle.DIM, CLIStyle.GRAY)
+            bar = build_progress_bar(self.style, status, bar_width)
+            agent_lines.append((f"{label} {bar} {status_text}", label_len + bar_width + status_len + 2))
+        render_panel(self.style, "Agent Progress", agent_lines, out=frame)
 
         # Show synthesis status if available
-        synthesis_status = self.orchestrator.get_synthesis_status()
         if synthesis_status is not None:
             if "SYNTHESIZING" in synthesis_status.upper():
-                synth_color = CLIStyle.ORANGE
-                synth_bar = self.style.color("▣" * (max(18, min(56, terminal_width() - 52)) // 2), CLIStyle.ORANGE)
+                synth_bar_len = bar_width // 2
+                synth_bar = self.style.color("▣" * synth_bar_len, CLIStyle.ORANGE)
             else:
-                synth_color = CLIStyle.GREEN
-                synth_bar = self.style.color("■" * max(18, min(56, terminal_width() - 52)), CLIStyle.GREEN)
-            synth_line = (
-                f"{self.style.color('Synthesis', CLIStyle.BOLD, CLIStyle.CYAN)} "
-                f"{synth_bar} "
-                f"{self.style.color(synthesis_status, CLIStyle.DIM, CLIStyle.GRAY)}"
-            )
-            render_panel(self.style, "Synthesis", [synth_line])
+                synth_bar_len = bar_width
+                synth_bar = self.style.color("■" * synth_bar_len, CLIStyle.GREEN)
+            label, label_len = self.style.color_measured("Synthesis", CLIStyle.BOLD, CLIStyle.CYAN)
+            status_text, status_len = self.style.color_measured(synthesis_status, CLIStyle.DIM, CLIStyle.GRAY)
+            synth_line = (f"{label} {synth_bar} {status_text}", label_len + synth_bar_len + status_len + 2)
+            render_panel(self.style, "Synthesis", [synth_line], out=frame)
+
+        self.write_frame(frame)
+
+    def write_frame(self, rows):
+        with self._frame_lock:
+            self._write_frame(rows)
+
+    def _write_frame(self, rows):
+        if not (self.style.enabled and os.name != "nt"):
+            self.clear_screen()
+            sys.stdout.write("\n".join(rows) + "\n")
+            sys.stdout.flush()
+            return
 
+        size = _terminal_size(100)
+        if (
+            len(rows) >= size.lines
+            or size.columns < terminal_width()
+            or any(ansi_visible_len(row) > size.columns for row in rows)
+        ):
+            # Positions below assume one screen line per row. A frame taller than the screen
+            # scrolls, and a row wider than it (panels never shrink below 80 columns) wraps,
+            # so either case gets a full clear-and-redraw instead.
+            sys.stdout.write(CLEAR_SCREEN + "\n".join(rows) + "\n")
+            sys.stdout.flush()
+            self._last_frame = None
+            return
+
+        previous = self._last_frame
+        if previous is None:
+            # Draw over the screen in place: each row clears its own tail, then the rest is erased.
+            output = CURSOR_HOME + ROW_END.join(rows) + ROW_END + ERASE_BELOW
+        else:
+            # Only rows that changed since the last frame are rewritten.
+            parts = [
+                f"\x1b[{index + 1};1H{row}\x1b[K"
+                for index, row in enumerate(rows)
+                if index >= len(previous) or previous[index] != row
+            ]
+            parts.append(f"\x1b[{len(rows) + 1};1H")
+            if len(rows) < len(previous):
+                parts.append(ERASE_BELOW)
+            output = "".join(parts)
+        sys.stdout.write(output)
         sys.stdout.flush()
+        self._last_frame = rows
 
     def progress_monitor(self):
+        progress_event = self.orchestrator.progress_event
         while self.running:
+            # Cleared before the state is read, so a change that lands mid-draw wakes the next wait.
+            progress_event.clear()
             self.update_display()
-            time.sleep(0.4)
+            # Redraw on status changes; the timeout keeps the elapsed-time row ticking.
+            progress_event.wait(timeout=1.0)
 
     def run_task(self, user_input: str):
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.running = True
+        with self._frame_lock:
+            self._last_frame = None
+        self._last_signature = None
         progress_thread = threading.Thread(target=self.progress_monitor, daemon=True)
         progress_thread.start()
 
@@ -291,7 +503,7 @@ class OrchestratorCLI:
             self.update_display(force=True)
 
             if should_log_successful_result(result or ""):
-                append_exchange_to_log(self.session_log_path, user_input, result)
+                append_exchange_to_log(self.session_log, user_input, result)
 
             response_lines = wrap_response_text(result or "", width=terminal_width() - 10)
             if not response_lines:
@@ -1,16 +1,54 @@
+import asyncio
+import hashlib
 import json
-import yaml
+import queue
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, wait
+from collections import OrderedDict, defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import List, Dict, Any, Optional
-from agent import AIAgent
+from agent import AIAgent, load_config
+from text_utils import MIN_SIMILARITY_LENGTH, SIMILARITY_THRESHOLD, fingerprint_similarity, loads, shingle_fingerprint
+
+# Statuses the orchestrator sets when it stops waiting for an agent; they stay until the next run.
+_FINAL_STATUSES = frozenset(("TIMEOUT", "SKIPPED"))
+
+# Generated research questions of earlier runs, keyed by TaskOrchestrator._subtask_cache_key();
+# used when orchestrator.subtask_cache is on.
+_subtask_cache: "OrderedDict[str, tuple]" = OrderedDict()
+# Synthesized answers keyed by TaskOrchestrator._synthesis_cache_key(); used when
+# orchestrator.synthesis_cache is on.
+_synthesis_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _get_cached(cache: OrderedDict, key: str, ttl: float) -> Optional[Any]:
+    """Return a cached value that is younger than ttl seconds."""
+    with _cache_lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > ttl:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+
+
+def _store_cached(cache: OrderedDict, key: str, value: Any, max_entries: int) -> None:
+    """Remember a value, evicting the least recently used entries beyond max_entries."""
+    with _cache_lock:
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > max_entries:
+            cache.popitem(last=False)
+
 
 class TaskOrchestrator:
     def __init__(self, config_path="config.yaml", provider_name=None, silent=False):
-        # Load configuration
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        # Load configuration (parsed once per file version and shared with the agents)
+        self.config = load_config(config_path)
 
         orchestrator_config = self.config.get('orchestrator', {})
         self.num_agents = int(orchestrator_config.get('parallel_agents', 4))
@@ -42,6 +80,10 @@ class TaskOrchestrator:
         rate_limited_providers = {"groq", "cerebras"}
         if self.agent_stagger_seconds == 0 and self.provider_name in rate_limited_providers:
             self.agent_stagger_seconds = 2.0
+        # Start synthesis once this many agents succeeded (0 = wait for every agent),
+        # giving the remaining ones a short grace period to finish
+        self.synthesis_quorum = max(0, min(int(orchestrator_config.get('synthesis_quorum', 0)), self.num_agents))
+        self.straggler_grace_seconds = float(orchestrator_config.get('straggler_grace_seconds', 10))
         
         # Initialize provider using factory
         # Get provider-specific configuration
@@ -55,8 +97,16 @@ class TaskOrchestrator:
         # Track agent progress
         self.agent_progress = {}
         self.agent_results = {}
+        # Immutable copy of agent_progress items, replaced on every write so readers need no lock
+        self._progress_snapshot = ()
         self.synthesis_status = None  # None = not started, "SYNTHESIZING..." or "DONE"
         self.progress_lock = threading.Lock()
+        # Set whenever agent or synthesis status changes so displays can redraw without polling
+        self.progress_event = threading.Event()
+        # Idle agents per role ("worker", "decompose", "synthesis"), reused across orchestrations
+        self._agent_pools = defaultdict(queue.SimpleQueue)
+        # Worker threads for agent tasks, created on first use and kept across orchestrations
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def _is_retryable_error(self, exc: Exception) -> bool:
         """Detect retryable LLM/provider failures."""
@@ -126,29 +176,98 @@ class TaskOrchestrator:
 
         return normalized[:num_agents]
     
+    def _build_agent(self, role: str) -> AIAgent:
+        """Create an agent configured for one orchestration role."""
+        agent = AIAgent(silent=True, provider_name=self.provider_name)
+        if role == "decompose":
+            # Keep original behavior: only disable completion signaling for this stage.
+            agent.tools = [
+                tool for tool in agent.tools
+                if tool.get('function', {}).get('name') != 'mark_task_complete'
+            ]
+            agent.tool_mapping = {
+                name: func for name, func in agent.tool_mapping.items()
+                if name != 'mark_task_complete'
+            }
+        elif role == "synthesis":
+            # Completely remove all tools from synthesis agent to force direct response
+            agent.tools = []
+            agent.tool_mapping = {}
+        return agent
+
+    def _checkout_agent(self, role: str) -> AIAgent:
+        """Take an idle agent for role from the pool, building one when none is free."""
+        try:
+            return self._agent_pools[role].get_nowait()
+        except queue.Empty:
+            return self._build_agent(role)
+
+    def _checkin_agent(self, role: str, agent: AIAgent) -> None:
+        """Return an agent to its pool; AIAgent.run() starts every task from fresh state."""
+        self._agent_pools[role].put(agent)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared agent thread pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="agent")
+        return self._executor
+
+    def _discard_executor(self) -> None:
+        """Drop the shared pool without blocking on threads that are still busy."""
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        try:
+            executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            # Python 3.8 compatibility (cancel_futures unavailable).
+            executor.shutdown(wait=False)
+
+    def close(self) -> None:
+        """Release the worker threads held by this orchestrator."""
+        self._discard_executor()
+
+    def _checkin_prewarmed(self, agent_future: Future) -> None:
+        """Pool a prewarmed worker agent that ended up not being used."""
+        if agent_future.exception() is None:
+            self._checkin_agent("worker", agent_future.result())
+
+    def _subtask_cache_key(self, user_input: str, num_agents: int, prompt_template: str) -> Optional[str]:
+        """Key for the subtask cache, or None when orchestrator.subtask_cache is disabled."""
+        if not self.config['orchestrator'].get('subtask_cache', False):
+            return None
+        key_source = "\x1f".join((
+            str(self.provider_name),
+            str(self.config.get(self.provider_name, {}).get('model')),
+            prompt_template,
+            str(num_agents),
+            user_input,
+        ))
+        return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+
     def decompose_task(self, user_input: str, num_agents: int) -> List[str]:
         """Use AI to dynamically generate different questions based on user input"""
         
-        # Create question generation agent
-        question_agent = AIAgent(silent=True, provider_name=self.provider_name)
-        
         # Get question generation prompt from config
-        prompt_template = self.config['orchestrator']['question_generation_prompt']
+        orchestrator_config = self.config['orchestrator']
+        prompt_template = orchestrator_config['question_generation_prompt']
+
+        # Repeated queries reuse the questions generated last time instead of another LLM call
+        cache_key = self._subtask_cache_key(user_input, num_agents, prompt_template)
+        if cache_key is not None:
+            ttl = float(orchestrator_config.get('subtask_cache_ttl', 3600))
+            cached = _get_cached(_subtask_cache, cache_key, ttl)
+            if cached is not None:
+                return list(cached)
+
+        # Get question generation agent
+        question_agent = self._checkout_agent("decompose")
+        
         generation_prompt = prompt_template.format(
             user_input=user_input,
             num_agents=num_agents
         )
         
-        # Keep original behavior: only disable completion signaling for this stage.
-        question_agent.tools = [
-            tool for tool in question_agent.tools
-            if tool.get('function', {}).get('name') != 'mark_task_complete'
-        ]
-        question_agent.tool_mapping = {
-            name: func for name, func in question_agent.tool_mapping.items()
-            if name != 'mark_task_complete'
-        }
-        
         try:
             # Get AI-generated questions
             response = question_agent.run(generation_prompt)
@@ -156,104 +275,163 @@ class TaskOrchestrator:
             # Parse JSON response (also handle wrapped markdown blocks)
             cleaned_response = response.strip()
             try:
-                questions = json.loads(cleaned_response)
+                questions = loads(cleaned_response)
             except json.JSONDecodeError:
                 start = cleaned_response.find('[')
                 end = cleaned_response.rfind(']')
                 if start == -1 or end == -1 or start >= end:
                     raise
-                questions = json.loads(cleaned_response[start:end + 1])
+                questions = loads(cleaned_response[start:end + 1])
             
-            return self._normalize_generated_subtasks(questions, user_input, num_agents)
+            subtasks = self._normalize_generated_subtasks(questions, user_input, num_agents)
+            if cache_key is not None:
+                max_entries = int(orchestrator_config.get('subtask_cache_size', 256))
+                _store_cached(_subtask_cache, cache_key, tuple(subtasks), max_entries)
+            return subtasks
             
         except Exception:
             # Fallback: create simple variations if AI fails
             return self._build_fallback_subtasks(user_input, num_agents)
+        finally:
+            self._checkin_agent("decompose", question_agent)
     
     def update_agent_progress(self, agent_id: int, status: str, result: str = None):
         """Thread-safe progress tracking"""
+        # Workers and the orchestrating thread (result collection, duplicate mirroring) both write here.
         with self.progress_lock:
+            if self.agent_progress.get(agent_id) in _FINAL_STATUSES:
+                # The orchestrator stopped waiting for this agent; a late worker must not overwrite that.
+                return
             self.agent_progress[agent_id] = status
             if result is not None:
                 self.agent_results[agent_id] = result
+            self._progress_snapshot = tuple(self.agent_progress.items())
+        self.progress_event.set()
+
+    def _queue_agents(self, agent_ids=None) -> None:
+        """Show the given agent slots (all by default) as queued, replacing any final status."""
+        with self.progress_lock:
+            for i in range(self.num_agents) if agent_ids is None else agent_ids:
+                self.agent_progress[i] = "QUEUED"
+            self._progress_snapshot = tuple(self.agent_progress.items())
+        self.progress_event.set()
     
-    def run_agent_parallel(self, agent_id: int, subtask: str) -> Dict[str, Any]:
+    def _mark_attempt(self, agent_id: int, attempt: int) -> None:
+        """Report that an agent attempt is starting."""
+        if attempt == 1:
+            self.update_agent_progress(agent_id, "PROCESSING...")
+        else:
+            self.update_agent_progress(agent_id, f"RETRY {attempt}/{self.agent_retry_attempts}...")
+
+    def _retry_backoff(self, agent_id: int, attempt: int, exc: Exception) -> Optional[float]:
+        """Seconds to wait before retrying after exc, or None when the agent should give up."""
+        if attempt >= self.agent_retry_attempts or not self._is_retryable_error(exc):
+            return None
+        self.update_agent_progress(agent_id, f"RETRYING ({attempt}/{self.agent_retry_attempts})")
+        return self.agent_retry_backoff_seconds * (2 ** (attempt - 1))
+
+    def _agent_success(self, agent_id: int, response: str, start_time: float) -> Dict[str, Any]:
+        """Record a finished agent and build its result dictionary."""
+        execution_time = time.time() - start_time
+        self.update_agent_progress(agent_id, "COMPLETED", response)
+        return {
+            "agent_id": agent_id,
+            "status": "success",
+            "response": response,
+            "execution_time": execution_time
+        }
+
+    def _agent_failure(self, agent_id: int, last_error: Optional[Exception], start_time: float) -> Dict[str, Any]:
+        """Record an agent that ran out of attempts and build its result dictionary."""
+        execution_time = time.time() - start_time
+        error_text = str(last_error) if last_error else "Unknown orchestration error."
+        self.update_agent_progress(agent_id, f"FAILED: {error_text}")
+        return {
+            "agent_id": agent_id,
+            "status": "error",
+            "response": f"Error: {error_text}",
+            "execution_time": execution_time
+        }
+
+    def run_agent_parallel(self, agent_id: int, subtask: str, agent_future: Optional[Future] = None) -> Dict[str, Any]:
         """
         Run a single agent with the given subtask.
+        agent_future optionally supplies an agent constructed ahead of time for the first attempt.
         Returns result dictionary with agent_id, status, and response.
         """
         start_time = time.time()
         last_error: Optional[Exception] = None
-        status_prefix = "PROCESSING..."
 
         for attempt in range(1, self.agent_retry_attempts + 1):
-            if attempt == 1:
-                self.update_agent_progress(agent_id, status_prefix)
-            else:
-                self.update_agent_progress(agent_id, f"RETRY {attempt}/{self.agent_retry_attempts}...")
-
+            self._mark_attempt(agent_id, attempt)
             try:
-                # Use AIAgent with specified provider
-                agent = AIAgent(silent=True, provider_name=self.provider_name)
-                response = agent.run(subtask)
-                execution_time = time.time() - start_time
+                # Use a pooled AIAgent with specified provider, or the prewarmed one on the first attempt
+                if attempt == 1 and agent_future is not None:
+                    agent = agent_future.result()
+                else:
+                    agent = self._checkout_agent("worker")
+                try:
+                    response = agent.run(subtask)
+                finally:
+                    self._checkin_agent("worker", agent)
+                return self._agent_success(agent_id, response, start_time)
+            except Exception as exc:
+                last_error = exc
+                backoff_seconds = self._retry_backoff(agent_id, attempt, exc)
+                if backoff_seconds is None:
+                    break
+                time.sleep(backoff_seconds)
 
-                self.update_agent_progress(agent_id, "COMPLETED", response)
+        return self._agent_failure(agent_id, last_error, start_time)
 
-                return {
-                    "agent_id": agent_id,
-                    "status": "success",
-                    "response": response,
-                    "execution_time": execution_time
-                }
+    async def arun_agent_parallel(self, agent_id: int, subtask: str) -> Dict[str, Any]:
+        """Asynchronous run_agent_parallel(), awaiting AIAgent.arun() instead of blocking a thread."""
+        start_time = time.time()
+        last_error: Optional[Exception] = None
+
+        for attempt in range(1, self.agent_retry_attempts + 1):
+            self._mark_attempt(agent_id, attempt)
+            try:
+                agent = self._checkout_agent("worker")
+                try:
+                    response = await agent.arun(subtask)
+                finally:
+                    self._checkin_agent("worker", agent)
+                return self._agent_success(agent_id, response, start_time)
             except Exception as exc:
                 last_error = exc
-                is_retryable = self._is_retryable_error(exc)
-                can_retry = attempt < self.agent_retry_attempts and is_retryable
-
-                if can_retry:
-                    backoff_seconds = self.agent_retry_backoff_seconds * (2 ** (attempt - 1))
-                    self.update_agent_progress(agent_id, f"RETRYING ({attempt}/{self.agent_retry_attempts})")
-                    time.sleep(backoff_seconds)
-                    continue
-                break
+                backoff_seconds = self._retry_backoff(agent_id, attempt, exc)
+                if backoff_seconds is None:
+                    break
+                await asyncio.sleep(backoff_seconds)
 
-        execution_time = time.time() - start_time
-        error_text = str(last_error) if last_error else "Unknown orchestration error."
-        self.update_agent_progress(agent_id, f"FAILED: {error_text}")
-        return {
-            "agent_id": agent_id,
-            "status": "error",
-            "response": f"Error: {error_text}",
-            "execution_time": execution_time
-        }
+        return self._agent_failure(agent_id, last_error, start_time)
     
     def aggregate_results(self, agent_results: List[Dict[str, Any]]) -> str:
         """
         Combine results from all agents into a comprehensive final answer.
         Uses the configured aggregation strategy.
         """
-        # LESS AGGRESSIVE FILTERING - Accept more responses as valid
-        successful_results = []
+        # LESS AGGRESSIVE FILTERING - Accept more responses as valid.
+        # One pass sorts every non-error response into substantial and short (fallback) buckets.
+        successful_results, responses = [], []
+        fallback_results, fallback_responses = [], []
         for r in agent_results:
             if r["status"] == "success" and r.get("response"):
                 response = str(r["response"]).strip()
                 # Only filter out obvious errors and completely empty responses
-                if response and not response.startswith("Error:") and len(response) > 10:
-                    successful_results.append(r)
+                if response and not response.startswith("Error:"):
+                    fallback_results.append(r)
+                    fallback_responses.append(response)
+                    if len(response) > 10:
+                        successful_results.append(r)
+                        responses.append(response)
         
         if not successful_results:
             # Check if any agents provided any response at all (even short ones)
-            fallback_results = []
-            for r in agent_results:
-                if r["status"] == "success" and r.get("response"):
-                    response = str(r["response"]).strip()
-                    if response and not response.startswith("Error:"):
-                        fallback_results.append(r)
-            
             if fallback_results:
                 # Use fallback results if we have any non-error responses
-                successful_results = fallback_results
+                successful_results, responses = fallback_results, fallback_responses
             else:
                 failure_lines = []
                 for result in agent_results:
@@ -290,13 +468,6 @@ class TaskOrchestrator:
                     )
                 return "All agents failed to provide meaningful results. Please try again with a different question."
         
-        # Extract responses for aggregation
-        responses = []
-        for r in successful_results:
-            response = str(r["response"]).strip()
-            if response:
-                responses.append(response)
-        
         if not responses:
             return "The agents processed the request but did not provide meaningful responses."
         
@@ -306,73 +477,263 @@ class TaskOrchestrator:
             # Default to consensus
             return self._aggregate_consensus(responses, successful_results)
     
+    @staticmethod
+    def _near_identical_response(responses: List[str]) -> Optional[str]:
+        """Return the longest response when every pair of responses says the same thing, otherwise None."""
+        # Same normalization and shingle similarity the agent uses to drop duplicate blocks.
+        norms = [" ".join(response.lower().split()) for response in responses]
+        if len(set(norms)) > 1:
+            if min(len(normalized) for normalized in norms) < MIN_SIMILARITY_LENGTH:
+                return None
+            # Similarity is not transitive, so all pairs are compared; N is the agent count.
+            fingerprints = [shingle_fingerprint(normalized) for normalized in norms]
+            for i, first in enumerate(fingerprints):
+                for second in fingerprints[i + 1:]:
+                    if fingerprint_similarity(first, second) < SIMILARITY_THRESHOLD:
+                        return None
+        return max(responses, key=len)
+
+    @staticmethod
+    def _concatenate_responses(responses: List[str]) -> str:
+        """Fallback answer listing every agent response under its own heading."""
+        return "\n".join(
+            f"=== Agent {i} Response ===\n{response}\n"
+            for i, response in enumerate(responses, 1)
+        ).strip()
+
+    def _synthesis_cache_key(self, valid_responses: List[str], prompt_template: str) -> Optional[str]:
+        """Key for the synthesis cache, or None when orchestrator.synthesis_cache is disabled."""
+        if not self.config['orchestrator'].get('synthesis_cache', False):
+            return None
+        # Agent completion order is not meaningful, so the same set of answers maps to one key.
+        key_source = "\x1f".join((
+            str(self.provider_name),
+            str(self.config.get(self.provider_name, {}).get('model')),
+            prompt_template,
+            *sorted(valid_responses),
+        ))
+        return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+
     def _aggregate_consensus(self, responses: List[str], _results: List[Dict[str, Any]]) -> str:
         """
         Use one final AI call to synthesize all agent responses into a coherent answer.
+        Responses arrive already stripped from aggregate_results().
         """
         # Filter out empty responses
-        valid_responses = [r.strip() for r in responses if r and r.strip()]
+        valid_responses = [r for r in responses if r]
         
         if not valid_responses:
             return "The agents processed the request but did not provide meaningful responses."
         
         if len(valid_responses) == 1:
             return valid_responses[0]
+
+        # Agents that converged on the same answer need no synthesis call
+        near_identical = self._near_identical_response(valid_responses)
+        if near_identical is not None:
+            return near_identical
         
+        orchestrator_config = self.config['orchestrator']
+        synthesis_prompt_template = orchestrator_config['synthesis_prompt']
+        cache_key = self._synthesis_cache_key(valid_responses, synthesis_prompt_template)
+        if cache_key is not None:
+            ttl = float(orchestrator_config.get('synthesis_cache_ttl', 3600))
+            cached = _get_cached(_synthesis_cache, cache_key, ttl)
+            if cached is not None:
+                with self.progress_lock:
+                    self.synthesis_status = "COMPLETED"
+                self.progress_event.set()
+                return cached
+
         # Signal synthesis phase
         with self.progress_lock:
             self.synthesis_status = "SYNTHESIZING..."
+        self.progress_event.set()
 
-        # Create synthesis agent to combine all responses
-        synthesis_agent = AIAgent(silent=True, provider_name=self.provider_name)
+        # Get synthesis agent to combine all responses
+        synthesis_agent = self._checkout_agent("synthesis")
         
         # Build agent responses section
-        agent_responses_text = ""
-        for i, response in enumerate(valid_responses, 1):
-            agent_responses_text += f"=== AGENT {i} RESPONSE ===\n{response}\n\n"
+        agent_responses_text = "".join(
+            f"=== AGENT {i} RESPONSE ===\n{response}\n\n"
+            for i, response in enumerate(valid_responses, 1)
+        )
         
-        # Get synthesis prompt from config and format it
-        synthesis_prompt_template = self.config['orchestrator']['synthesis_prompt']
+        # Format the synthesis prompt from config
         synthesis_prompt = synthesis_prompt_template.format(
             num_responses=len(valid_responses),
             agent_responses=agent_responses_text
         )
         
-        # Completely remove all tools from synthesis agent to force direct response
-        synthesis_agent.tools = []
-        synthesis_agent.tool_mapping = {}
-        
         # Get the synthesized response
         try:
             final_answer = synthesis_agent.run(synthesis_prompt)
             with self.progress_lock:
                 self.synthesis_status = "COMPLETED"
+            self.progress_event.set()
             if final_answer and final_answer.strip():
-                return final_answer.strip()
+                final_answer = final_answer.strip()
+                if cache_key is not None:
+                    max_entries = int(orchestrator_config.get('synthesis_cache_size', 256))
+                    _store_cached(_synthesis_cache, cache_key, final_answer, max_entries)
+                return final_answer
             else:
                 # If synthesis returns empty, fallback to concatenation
-                combined = []
-                for i, response in enumerate(valid_responses, 1):
-                    combined.append(f"=== Agent {i} Response ===")
-                    combined.append(response)
-                    combined.append("")
-                return "\n".join(combined).strip()
+                return self._concatenate_responses(valid_responses)
         except Exception as e:
             # Log the error for debugging
             print(f"\n🚨 SYNTHESIS FAILED: {str(e)}")
             print("📋 Falling back to concatenated responses\n")
             # Fallback: if synthesis fails, concatenate responses
-            combined = []
-            for i, response in enumerate(valid_responses, 1):
-                combined.append(f"=== Agent {i} Response ===")
-                combined.append(response)
-                combined.append("")
-            return "\n".join(combined).strip()
+            return self._concatenate_responses(valid_responses)
+        finally:
+            self._checkin_agent("synthesis", synthesis_agent)
     
+    @staticmethod
+    def _count_successes(finished) -> int:
+        """Number of finished agent futures or tasks whose run succeeded."""
+        # One result() call per future reads its state once instead of exception() then result().
+        successes = 0
+        for future in finished:
+            try:
+                if future.result().get("status") == "success":
+                    successes += 1
+            except Exception:
+                pass
+        return successes
+
+    def _wait_for_agents(self, futures) -> tuple:
+        """
+        Wait for agent futures up to the task timeout, or until the synthesis quorum is met
+        and the straggler grace period has passed.
+        Returns (done, not_done, quorum_reached).
+        """
+        if not self.synthesis_quorum:
+            done, not_done = wait(futures, timeout=self.task_timeout)
+            return done, not_done, False
+
+        deadline = time.monotonic() + self.task_timeout
+        done = set()
+        pending = set(futures)
+        successes = 0
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            finished, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            done |= finished
+            successes += self._count_successes(finished)
+            if successes >= self.synthesis_quorum:
+                grace = min(self.straggler_grace_seconds, max(0.0, deadline - time.monotonic()))
+                finished, pending = wait(pending, timeout=grace)
+                done |= finished
+                return done, pending, True
+        return done, pending, False
+
+    async def _await_agents(self, tasks) -> tuple:
+        """Asyncio counterpart of _wait_for_agents() for agent tasks."""
+        if not self.synthesis_quorum:
+            done, not_done = await asyncio.wait(tasks, timeout=self.task_timeout)
+            return done, not_done, False
+
+        event_loop = asyncio.get_running_loop()
+        deadline = event_loop.time() + self.task_timeout
+        done = set()
+        pending = set(tasks)
+        successes = 0
+        while pending:
+            remaining = deadline - event_loop.time()
+            if remaining <= 0:
+                break
+            finished, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            done |= finished
+            successes += self._count_successes(finished)
+            if successes >= self.synthesis_quorum:
+                grace = min(self.straggler_grace_seconds, max(0.0, deadline - event_loop.time()))
+                if pending:
+                    finished, pending = await asyncio.wait(pending, timeout=grace)
+                    done |= finished
+                return done, pending, True
+        return done, pending, False
+
+    def _collect_agent_results(self, done, not_done, future_to_agent, quorum_reached: bool) -> List[Dict[str, Any]]:
+        """Turn finished and unfinished agent futures (or tasks) into result dictionaries."""
+        agent_results = []
+
+        # Collect completed futures.
+        for future in done:
+            try:
+                result = future.result()
+                agent_results.append(result)
+            except Exception as e:
+                agent_id = future_to_agent[future]
+                self.update_agent_progress(agent_id, f"FAILED: {str(e)}")
+                agent_results.append({
+                    "agent_id": agent_id,
+                    "status": "error",
+                    "response": f"Agent {agent_id + 1} failed: {str(e)}",
+                    "execution_time": 0
+                })
+
+        # Mark timed-out futures without failing the entire orchestration.
+        for future in not_done:
+            agent_id = future_to_agent[future]
+            future.cancel()
+            if quorum_reached:
+                self.update_agent_progress(agent_id, "SKIPPED")
+                response = f"Agent {agent_id + 1} did not finish before synthesis started."
+            else:
+                self.update_agent_progress(agent_id, "TIMEOUT")
+                response = f"Agent {agent_id + 1} timed out after {self.task_timeout} seconds."
+            agent_results.append({
+                "agent_id": agent_id,
+                "status": "timeout",
+                "response": response,
+                "execution_time": self.task_timeout
+            })
+
+        # Sort results by agent_id for consistent output
+        agent_results.sort(key=lambda x: x["agent_id"])
+        return agent_results
+
+    def _needs_sequential_fallback(self, agent_results: List[Dict[str, Any]]) -> bool:
+        """True when every agent failed in parallel and one sequential rerun is configured."""
+        return (
+            self.sequential_fallback_on_total_failure
+            and bool(agent_results)
+            and all(result.get("status") in ("error", "timeout") for result in agent_results)
+            and self.max_concurrency > 1
+        )
+
+    @staticmethod
+    def _duplicate_slots(subtasks: List[str]) -> Dict[int, int]:
+        """Map every slot whose subtask repeats an earlier one to that earlier slot."""
+        first_slot: Dict[str, int] = {}
+        duplicates = {}
+        for index, subtask in enumerate(subtasks):
+            slot = first_slot.setdefault(subtask, index)
+            if slot != index:
+                duplicates[index] = slot
+        return duplicates
+
+    def _mirror_duplicate_progress(self, duplicates: Dict[int, int]) -> None:
+        """Show the outcome of each shared subtask on the slots that skipped running it."""
+        progress = self.get_progress_status()
+        for index, slot in duplicates.items():
+            self.update_agent_progress(index, progress.get(slot, "QUEUED"))
+
+    def _reset_progress(self) -> None:
+        """Clear agent and synthesis progress before a new orchestration."""
+        with self.progress_lock:
+            self.agent_progress = {}
+            self.agent_results = {}
+            self._progress_snapshot = ()
+            self.synthesis_status = None
+
     def get_progress_status(self) -> Dict[int, str]:
         """Get current progress status for all agents"""
-        with self.progress_lock:
-            return self.agent_progress.copy()
+        # Writers swap in a new immutable snapshot under the lock; reading the reference needs none.
+        return dict(self._progress_snapshot)
 
     def get_synthesis_status(self) -> Optional[str]:
         """Get current synthesis status."""
@@ -386,78 +747,55 @@ class TaskOrchestrator:
         """
         
         # Reset progress tracking
-        self.agent_progress = {}
-        self.agent_results = {}
-        with self.progress_lock:
-            self.synthesis_status = None
+        self._reset_progress()
         
+        # Workers not covered by idle pooled agents are built while the subtasks are being generated
+        missing_agents = max(0, self.num_agents - self._agent_pools["worker"].qsize())
+        agent_futures: List[Optional[Future]] = [None] * (self.num_agents - missing_agents)
+        if missing_agents:
+            prewarm_executor = ThreadPoolExecutor(max_workers=missing_agents, thread_name_prefix="agent-prewarm")
+            agent_futures.extend(prewarm_executor.submit(self._build_agent, "worker") for _ in range(missing_agents))
+            prewarm_executor.shutdown(wait=False)
+
         # Decompose task into subtasks
         subtasks = self.decompose_task(user_input, self.num_agents)
         
         # Initialize progress tracking
-        for i in range(self.num_agents):
-            self.agent_progress[i] = "QUEUED"
+        self._queue_agents()
+
+        # A subtask that appears more than once is only run by its first slot
+        duplicates = self._duplicate_slots(subtasks)
+        agent_ids = [i for i in range(self.num_agents) if i not in duplicates]
+        for i in duplicates:
+            if agent_futures[i] is not None:
+                agent_futures[i].add_done_callback(self._checkin_prewarmed)
         
         # Execute agents in parallel
-        agent_results = []
-        
-        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        executor = self._get_executor()
+        # Stays False if agents time out or submission fails, so stuck threads are not reused.
+        reusable = False
         try:
             # Submit all agent tasks with optional stagger delay
             future_to_agent = {}
-            for i in range(self.num_agents):
-                future = executor.submit(self.run_agent_parallel, i, subtasks[i])
+            for position, i in enumerate(agent_ids):
+                future = executor.submit(self.run_agent_parallel, i, subtasks[i], agent_futures[i])
                 future_to_agent[future] = i
-                if self.agent_stagger_seconds > 0 and i < self.num_agents - 1:
+                if self.agent_stagger_seconds > 0 and position < len(agent_ids) - 1:
                     time.sleep(self.agent_stagger_seconds)
 
-            # Wait for completion up to global task timeout.
-            done, not_done = wait(future_to_agent.keys(), timeout=self.task_timeout)
-
-            # Collect completed futures.
-            for future in done:
-                try:
-                    result = future.result()
-                    agent_results.append(result)
-                except Exception as e:
-                    agent_id = future_to_agent[future]
-                    self.update_agent_progress(agent_id, f"FAILED: {str(e)}")
-                    agent_results.append({
-                        "agent_id": agent_id,
-                        "status": "error",
-                        "response": f"Agent {agent_id + 1} failed: {str(e)}",
-                        "execution_time": 0
-                    })
-
-            # Mark timed-out futures without failing the entire orchestration.
-            for future in not_done:
-                agent_id = future_to_agent[future]
-                future.cancel()
-                self.update_agent_progress(agent_id, "TIMEOUT")
-                agent_results.append({
-                    "agent_id": agent_id,
-                    "status": "timeout",
-                    "response": f"Agent {agent_id + 1} timed out after {self.task_timeout} seconds.",
-                    "execution_time": self.task_timeout
-                })
+            # Wait for completion up to global task timeout (or quorum plus grace period).
+            done, not_done, quorum_reached = self._wait_for_agents(future_to_agent.keys())
+            agent_results = self._collect_agent_results(done, not_done, future_to_agent, quorum_reached)
+            reusable = not not_done
         finally:
-            # Do not block on pending worker threads after timeout.
-            try:
-                executor.shutdown(wait=False, cancel_futures=True)
-            except TypeError:
-                # Python 3.8 compatibility (cancel_futures unavailable).
-                executor.shutdown(wait=False)
-        
-        # Sort results by agent_id for consistent output
-        agent_results.sort(key=lambda x: x["agent_id"])
+            # Do not block on pending worker threads after timeout; the next run gets a fresh pool.
+            if not reusable:
+                self._discard_executor()
 
         # If everything failed, attempt one sequential rerun for failed agents.
-        if (
-            self.sequential_fallback_on_total_failure
-            and agent_results
-            and all(result.get("status") in ("error", "timeout") for result in agent_results)
-            and self.max_concurrency > 1
-        ):
+        if self._needs_sequential_fallback(agent_results):
+            # Timed-out slots are re-queued so the rerun can report progress on them again.
+            self._queue_agents([int(result["agent_id"]) for result in agent_results])
             sequential_results = []
             for result in agent_results:
                 agent_id = int(result["agent_id"])
@@ -465,8 +803,53 @@ class TaskOrchestrator:
                 sequential_results.append(sequential_result)
             sequential_results.sort(key=lambda x: x["agent_id"])
             agent_results = sequential_results
+        self._mirror_duplicate_progress(duplicates)
         
         # Aggregate results
         final_result = self.aggregate_results(agent_results)
         
         return final_result
+
+    async def orchestrate_async(self, user_input: str) -> str:
+        """
+        Asynchronous orchestrate(), for callers that already run an event loop.
+        Worker agents run as tasks on the loop through AIAgent.arun(), limited to
+        max_concurrency at a time; subtask generation and synthesis run in the default executor.
+        """
+        self._reset_progress()
+        event_loop = asyncio.get_running_loop()
+
+        subtasks = await event_loop.run_in_executor(None, self.decompose_task, user_input, self.num_agents)
+
+        self._queue_agents()
+
+        duplicates = self._duplicate_slots(subtasks)
+        agent_ids = [i for i in range(self.num_agents) if i not in duplicates]
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_limited(agent_id: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.arun_agent_parallel(agent_id, subtasks[agent_id])
+
+        task_to_agent = {}
+        for position, i in enumerate(agent_ids):
+            task_to_agent[asyncio.ensure_future(run_limited(i))] = i
+            if self.agent_stagger_seconds > 0 and position < len(agent_ids) - 1:
+                await asyncio.sleep(self.agent_stagger_seconds)
+
+        done, not_done, quorum_reached = await self._await_agents(set(task_to_agent))
+        agent_results = self._collect_agent_results(done, not_done, task_to_agent, quorum_reached)
+
+        if self._needs_sequential_fallback(agent_results):
+            # Timed-out slots are re-queued so the rerun can report progress on them again.
+            self._queue_agents([int(result["agent_id"]) for result in agent_results])
+            sequential_results = []
+            for result in agent_results:
+                agent_id = int(result["agent_id"])
+                sequential_results.append(await self.arun_agent_parallel(agent_id, subtasks[agent_id]))
+            sequential_results.sort(key=lambda x: x["agent_id"])
+            agent_results = sequential_results
+        self._mirror_duplicate_progress(duplicates)
+
+        return await event_loop.run_in_executor(None, self.aggregate_results, agent_results)
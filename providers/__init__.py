@@ -2,11 +2,33 @@
 Provider factory and registry for multi-provider AI support.
 """
 
-import importlib
-from typing import Dict, Type
+import threading
+from collections import OrderedDict
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type
 
 from .base_provider import BaseProvider
 
+if TYPE_CHECKING:
+    # Static tools see the provider classes; at runtime they resolve lazily through __getattr__ below.
+    from .cerebras_provider import CerebrasProvider
+    from .groq_provider import GroqProvider
+    from .mistral_provider import MistralProvider
+    from .nvidia_provider import NvidiaProvider
+    from .ollama_provider import OllamaProvider
+    from .openrouter_provider import OpenRouterProvider
+    from .sambanova_provider import SambaNovaProvider
+
+
+def _freeze_config(value: Any) -> Any:
+    """Hashable stand-in for a config value, including nested dicts and lists."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze_config(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_config(item) for item in value)
+    return value
+
+
 class ProviderFactory:
     """Factory class for creating AI providers based on configuration."""
     
@@ -58,24 +80,43 @@ class ProviderFactory:
         }
     }
 
+    # Provider names in registry order
+    _available_providers: Tuple[str, ...] = tuple(_provider_paths)
+
+    # (module name, class name) per provider, split once; only the import itself is deferred
+    _provider_targets: Dict[str, Tuple[str, str]] = {
+        provider_name: tuple(path.split(":")) for provider_name, path in _provider_paths.items()
+    }
+
     _provider_classes: Dict[str, Type[BaseProvider]] = {}
 
+    # Providers already built, keyed by (provider name, frozen config); least recently used last out
+    _instances: "OrderedDict[tuple, BaseProvider]" = OrderedDict()
+    _instances_lock = threading.Lock()
+    _max_instances = 32
+
+    @classmethod
+    def _unsupported_provider(cls, provider_name: str) -> ValueError:
+        """Error raised for names missing from the registry."""
+        return ValueError(
+            f"Unsupported provider: {provider_name}. "
+            f"Supported providers: {list(cls._available_providers)}"
+        )
+
     @classmethod
     def _load_provider_class(cls, provider_name: str) -> Type[BaseProvider]:
         """Load provider class lazily to avoid import-time dependency failures."""
-        if provider_name in cls._provider_classes:
-            return cls._provider_classes[provider_name]
+        provider_class = cls._provider_classes.get(provider_name)
+        if provider_class is not None:
+            return provider_class
 
-        provider_path = cls._provider_paths.get(provider_name)
-        if not provider_path:
-            raise ValueError(
-                f"Unsupported provider: {provider_name}. "
-                f"Supported providers: {list(cls._provider_paths.keys())}"
-            )
+        target = cls._provider_targets.get(provider_name)
+        if target is None:
+            raise cls._unsupported_provider(provider_name)
 
-        module_name, class_name = provider_path.split(":")
+        module_name, class_name = target
         try:
-            module = importlib.import_module(module_name)
+            module = import_module(module_name)
         except ImportError as exc:
             raise ImportError(
                 f"Failed to import dependencies for provider '{provider_name}'. "
@@ -93,6 +134,10 @@ class ProviderFactory:
     def create_provider(cls, provider_name: str, config: dict) -> BaseProvider:
         """
         Create a provider instance based on the provider name.
+
+        Instances are shared between callers passing the same provider name and config
+        contents, so SDK clients and their connection pools are built once. Configs must
+        not be modified after they have been used to create a provider.
         
         Args:
             provider_name: Name of the provider ('openrouter', 'mistralai', 'sambanova', 'cerebras', 'ollama', 'groq', 'nvidia')
@@ -104,25 +149,67 @@ class ProviderFactory:
         Raises:
             ValueError: If provider_name is not supported
         """
-        if provider_name not in cls._provider_paths:
-            raise ValueError(
-                f"Unsupported provider: {provider_name}. "
-                f"Supported providers: {list(cls._provider_paths.keys())}"
-            )
-        
+        # Unknown names raise from _load_provider_class
         provider_class = cls._load_provider_class(provider_name)
-        return provider_class(config)
+        try:
+            key = (provider_name, _freeze_config(config))
+            hash(key)
+        except TypeError:
+            # Unhashable config values (e.g. custom objects) are never shared
+            return provider_class(dict(config))
+
+        with cls._instances_lock:
+            provider = cls._instances.get(key)
+            if provider is not None:
+                cls._instances.move_to_end(key)
+                return provider
+
+        # Built outside the lock so slow client setup does not serialize other providers.
+        # Validation fills in defaults (e.g. the model), so it gets a copy rather than the
+        # caller's dict, which load_config shares between callers.
+        provider = provider_class(dict(config))
+        # The filled-in config maps to the same instance
+        keys = {key, (provider_name, _freeze_config(provider.config))}
+        with cls._instances_lock:
+            provider = cls._instances.setdefault(key, provider)
+            for instance_key in keys:
+                cls._instances[instance_key] = provider
+                cls._instances.move_to_end(instance_key)
+            while len(cls._instances) > cls._max_instances:
+                cls._instances.popitem(last=False)
+        return provider
     
     @classmethod
-    def get_available_providers(cls) -> list:
-        """Get list of all available provider names."""
-        return list(cls._provider_paths.keys())
+    def get_available_providers(cls) -> List[str]:
+        """Get all available provider names."""
+        # A fresh list per call; callers may modify it without touching the registry tuple
+        return list(cls._available_providers)
     
     @classmethod
     def get_provider_info(cls, provider_name: str) -> dict:
         """Get information about a specific provider."""
-        if provider_name not in cls._provider_paths:
+        metadata = cls._provider_metadata.get(provider_name)
+        if metadata is None:
             return {}
-
-        metadata = cls._provider_metadata.get(provider_name, {})
         return {'name': provider_name, **metadata}
+
+
+# Provider class name -> registry name, so `from providers import GroqProvider` only imports that provider.
+_CLASS_TO_PROVIDER: Dict[str, str] = {
+    class_name: provider_name
+    for provider_name, (_, class_name) in ProviderFactory._provider_targets.items()
+}
+
+# Provider classes stay out of __all__: a star import would otherwise load every provider SDK.
+__all__ = ["BaseProvider", "ProviderFactory"]
+
+
+def __getattr__(name: str):
+    """Resolve provider classes on first access (PEP 562)."""
+    provider_name = _CLASS_TO_PROVIDER.get(name)
+    if provider_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider_class = ProviderFactory._load_provider_class(provider_name)
+    # Later lookups find the class in the module namespace and skip __getattr__.
+    globals()[name] = provider_class
+    return provider_class
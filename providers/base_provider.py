@@ -2,12 +2,17 @@
 Base provider interface for all AI providers.
 """
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Union
 
 class BaseProvider(ABC):
     """Abstract base class for all AI providers."""
     
+    # Subclasses that declare their own __slots__ avoid a per-instance __dict__
+    __slots__ = ('config',)
+    
     DISPLAY_NAME = "Base Provider"
     DESCRIPTION = "Base provider interface"
     DEFAULT_MODEL = None
@@ -41,6 +46,77 @@ class BaseProvider(ABC):
         """
         pass
     
+    async def acreate_chat_completion(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Asynchronous variant of create_chat_completion.
+        
+        Providers with an async SDK override this; the default runs the blocking
+        call in the event loop's default executor so it never stalls the loop.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys
+            tools: Optional list of tool definitions for function calling
+            
+        Returns:
+            Dictionary containing the completion response
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.create_chat_completion, messages, tools)
+        )
+    
+    def stream_chat_completion(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a chat completion as incremental deltas.
+        
+        Each delta is a dict with an optional 'content' fragment and an optional
+        'tool_calls' list. Tool call entries carrying an 'index' are fragments to be
+        merged by index; entries without one are complete tool calls. Providers
+        without native streaming yield the full completion as a single delta.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys
+            tools: Optional list of tool definitions for function calling
+            
+        Yields:
+            Delta dictionaries
+        """
+        response = self.create_chat_completion(messages, tools)
+        message = response.get('choices', [{}])[0].get('message', {})
+        yield {
+            'content': message.get('content') or "",
+            'tool_calls': message.get('tool_calls') or []
+        }
+    
+    @staticmethod
+    def _openai_stream_deltas(stream: Any) -> Iterator[Dict[str, Any]]:
+        """Convert OpenAI-compatible SDK stream chunks into plain delta dicts."""
+        for chunk in stream:
+            choices = getattr(chunk, 'choices', None)
+            if not choices:
+                continue
+            delta = getattr(choices[0], 'delta', None)
+            if delta is None:
+                continue
+            
+            tool_calls = []
+            for tool_call in getattr(delta, 'tool_calls', None) or []:
+                function = getattr(tool_call, 'function', None)
+                tool_calls.append({
+                    'index': getattr(tool_call, 'index', None),
+                    'id': getattr(tool_call, 'id', None),
+                    'type': 'function',
+                    'function': {
+                        'name': getattr(function, 'name', None) if function else None,
+                        'arguments': getattr(function, 'arguments', None) if function else None
+                    }
+                })
+            
+            yield {
+                'content': getattr(delta, 'content', None) or "",
+                'tool_calls': tool_calls
+            }
+    
     @abstractmethod
     def get_model_name(self) -> str:
         """Get the current model name being used."""
@@ -2,25 +2,97 @@
 Cerebras provider implementation using the official Cerebras Cloud SDK.
 """
 
+import functools
 import logging
+import operator
 import time
+from importlib.util import find_spec
 from typing import Dict, List, Any, Optional
 
-try:
-    from cerebras.cloud.sdk import Cerebras
-    CEREBRAS_AVAILABLE = True
-except ImportError:
-    CEREBRAS_AVAILABLE = False
-    Cerebras = None
-
 from .base_provider import BaseProvider
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+def _module_available(name: str) -> bool:
+    # find_spec imports parent packages but not the SDK module itself; a missing parent raises
+    try:
+        return find_spec(name) is not None
+    except ImportError:
+        return False
+
+
+# The SDK is only imported when a client is first built
+CEREBRAS_AVAILABLE = _module_available('cerebras.cloud.sdk')
+
+# SDK usage counters read in one C-level call
+_USAGE_FIELDS = operator.attrgetter('prompt_tokens', 'completion_tokens', 'total_tokens')
+
+
+def _make_choice(content: str, tool_calls: list) -> Dict[str, Any]:
+    return {'message': {'content': content, 'tool_calls': tool_calls}}
+
+
+def _make_usage(prompt_tokens: int, completion_tokens: int, total_tokens: int) -> Dict[str, int]:
+    return {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens, 'total_tokens': total_tokens}
+
+
+_MISSING = object()
+
+
+def _mapping_get(mapping, key):
+    try:
+        return mapping.get(key, _MISSING)
+    except TypeError:
+        return _MISSING
+
+
+def _sequence_get(sequence, key):
+    if isinstance(key, int):
+        return sequence[key] if 0 <= key < len(sequence) else _MISSING
+    return _attribute_get(sequence, key)
+
+
+def _attribute_get(obj, key):
+    return getattr(obj, key, _MISSING) if isinstance(key, str) else _MISSING
+
+
+# Lookup per concrete type. Subclasses (OrderedDict, namedtuples, ...) are resolved with
+# issubclass on first sight and cached, so later frames of that type skip the checks.
+_NESTED_GETTERS = {
+    dict: _mapping_get,
+    list: _sequence_get,
+    tuple: _sequence_get,
+    type(None): lambda obj, key: _MISSING,
+}
+
+
+def _nested_getter(cls):
+    getter = _NESTED_GETTERS.get(cls)
+    if getter is None:
+        if issubclass(cls, dict):
+            getter = _mapping_get
+        elif issubclass(cls, (list, tuple)):
+            getter = _sequence_get
+        else:
+            getter = _attribute_get
+        _NESTED_GETTERS[cls] = getter
+    return getter
+
+
+@functools.lru_cache(maxsize=8)
+def _get_cerebras_client(api_key: str):
+    # The SDK client is httpx-based and thread-safe, so providers sharing a key share its connection pool
+    from cerebras.cloud.sdk import Cerebras
+    return Cerebras(api_key=api_key)
+
+
 class CerebrasProvider(BaseProvider):
     """Cerebras provider using the official Cerebras Cloud SDK."""
     
+    __slots__ = ('client',)
+    
     DISPLAY_NAME = "Cerebras"
     DESCRIPTION = "Cerebras - Ultra-fast AI inference with wafer-scale processors"
     DEFAULT_MODEL = "llama-3.3-70b"
@@ -32,7 +104,7 @@ class CerebrasProvider(BaseProvider):
             )
         
         super().__init__(config)
-        self.client = Cerebras(api_key=self.config['api_key'])
+        self.client = _get_cerebras_client(self.config['api_key'])
     
     def _validate_config(self):
         """Validate Cerebras configuration."""
@@ -60,25 +132,12 @@ class CerebrasProvider(BaseProvider):
         Returns:
             Value at the specified path or default
         """
-        try:
-            current = data
-            for key in path:
-                if current is None:
-                    return default
-                if isinstance(key, int) and isinstance(current, (list, tuple)):
-                    if 0 <= key < len(current):
-                        current = current[key]
-                    else:
-                        return default
-                elif isinstance(current, dict):
-                    current = current.get(key, default)
-                elif hasattr(current, key):
-                    current = getattr(current, key)
-                else:
-                    return default
-            return current
-        except (TypeError, IndexError, AttributeError):
-            return default
+        current = data
+        for key in path:
+            current = _nested_getter(type(current))(current, key)
+            if current is _MISSING:
+                return default
+        return current
     
     def create_chat_completion(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -92,7 +151,7 @@ class CerebrasProvider(BaseProvider):
             Dictionary containing the completion response
         """
         try:
-            logger.info("Creating Cerebras chat completion")
+            logger.debug("Creating Cerebras chat completion")
             
             # Prepare request parameters
             request_params = {
@@ -116,7 +175,7 @@ class CerebrasProvider(BaseProvider):
                     is_rate_limit = any(s in err_msg for s in ["429", "too_many_requests", "queue_exceeded", "high traffic"])
                     if is_rate_limit and attempt < max_retries - 1:
                         wait_time = (2 ** attempt) * 3  # 3, 6, 12, 24 seconds
-                        logger.warning(f"Cerebras rate limited, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
+                        logger.warning("Cerebras rate limited, retrying in %ss (attempt %d/%d)", wait_time, attempt + 1, max_retries)
                         time.sleep(wait_time)
                         last_error = retry_err
                         continue
@@ -124,47 +183,35 @@ class CerebrasProvider(BaseProvider):
             else:
                 raise last_error
             
-            # Extract values safely with null handling
-            try:
-                # Handle both object and dict access
-                choices = response.choices
-                if choices and len(choices) > 0:
-                    first_choice = choices[0]
-                    message = first_choice.message
-                    content = message.content if message.content is not None else ""
-                    tool_calls = message.tool_calls if hasattr(message, 'tool_calls') and message.tool_calls else []
-                else:
-                    content = ""
-                    tool_calls = []
-                
-                # Handle usage information
-                prompt_tokens = 0
-                completion_tokens = 0
-                total_tokens = 0
-                
-                if hasattr(response, 'usage') and response.usage:
-                    usage = response.usage
+            # Extract values with None-guards; a malformed response degrades to empty content
+            choices = getattr(response, 'choices', None)
+            message = getattr(choices[0], 'message', None) if choices else None
+            if message is not None:
+                content = getattr(message, 'content', None) or ""
+                tool_calls = getattr(message, 'tool_calls', None) or []
+            else:
+                content = ""
+                tool_calls = []
+            
+            # Handle usage information
+            prompt_tokens = 0
+            completion_tokens = 0
+            total_tokens = 0
+            
+            usage = getattr(response, 'usage', None)
+            if usage:
+                try:
+                    prompt_tokens, completion_tokens, total_tokens = _USAGE_FIELDS(usage)
+                except AttributeError:
+                    # Partial usage objects: read whatever fields exist
                     prompt_tokens = getattr(usage, 'prompt_tokens', 0)
                     completion_tokens = getattr(usage, 'completion_tokens', 0)
                     total_tokens = getattr(usage, 'total_tokens', 0)
-                
-                return {
-                    'choices': [{
-                        'message': {
-                            'content': content,
-                            'tool_calls': tool_calls
-                        }
-                    }],
-                    'usage': {
-                        'prompt_tokens': prompt_tokens,
-                        'completion_tokens': completion_tokens,
-                        'total_tokens': total_tokens
-                    }
-                }
-                
-            except Exception as extract_error:
-                logger.error(f"Error extracting response data: {str(extract_error)}")
-                raise Exception(f"Failed to extract response data: {str(extract_error)}")
+            
+            return {
+                'choices': [_make_choice(content, tool_calls)],
+                'usage': _make_usage(prompt_tokens, completion_tokens, total_tokens)
+            }
                 
         except Exception as e:
             logger.error(f"Cerebras API call failed: {str(e)}")
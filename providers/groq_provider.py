@@ -146,6 +146,11 @@ class GroqProvider(BaseProvider):
         if not tools:
             return None
         
+        # Agents send the same tools list on every iteration; validate it only once.
+        cached = getattr(self, '_validated_tools_cache', None)
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+        
         validated_tools = []
         for i, tool in enumerate(tools):
             if not isinstance(tool, dict):
@@ -167,7 +172,9 @@ class GroqProvider(BaseProvider):
             
             validated_tools.append(tool)
         
-        return validated_tools if validated_tools else None
+        result = validated_tools if validated_tools else None
+        self._validated_tools_cache = (tools, result)
+        return result
     
     def _parse_text_format_tool_call(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -3,7 +3,7 @@ MistralAI provider implementation.
 """
 
 from openai import OpenAI
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
 from .base_provider import BaseProvider
 
 class MistralProvider(BaseProvider):
@@ -77,6 +77,28 @@ class MistralProvider(BaseProvider):
         except Exception as e:
             raise Exception(f"MistralAI API call failed: {str(e)}")
     
+    def stream_chat_completion(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a chat completion from MistralAI as incremental deltas.
+        
+        Args:
+            messages: List of message dictionaries
+            tools: Optional list of tool definitions
+            
+        Yields:
+            Delta dictionaries (see BaseProvider.stream_chat_completion)
+        """
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.config['model'],
+                messages=self._fix_message_ordering(messages),
+                tools=tools,
+                stream=True
+            )
+            yield from self._openai_stream_deltas(stream)
+        except Exception as e:
+            raise Exception(f"MistralAI API call failed: {str(e)}")
+    
     def _fix_message_ordering(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Fix message ordering for MistralAI API compatibility.
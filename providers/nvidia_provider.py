@@ -3,7 +3,7 @@ NVIDIA NIM provider implementation.
 """
 
 from openai import OpenAI
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
 from .base_provider import BaseProvider
 
 class NvidiaProvider(BaseProvider):
@@ -33,6 +33,20 @@ class NvidiaProvider(BaseProvider):
         if 'model' not in self.config or not self.config['model']:
             self.config['model'] = self.DEFAULT_MODEL
     
+    def _request_kwargs(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the request parameters shared by regular and streaming completions."""
+        kwargs = {
+            'model': self.config['model'],
+            'messages': messages,
+            'max_tokens': self.config.get('max_tokens', 16384),
+            'temperature': self.config.get('temperature', 1.0),
+            'top_p': self.config.get('top_p', 1.0),
+        }
+        
+        if tools:
+            kwargs['tools'] = tools
+        return kwargs
+    
     def create_chat_completion(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Create a chat completion using NVIDIA NIM API.
@@ -45,18 +59,7 @@ class NvidiaProvider(BaseProvider):
             Dictionary containing the completion response
         """
         try:
-            kwargs = {
-                'model': self.config['model'],
-                'messages': messages,
-                'max_tokens': self.config.get('max_tokens', 16384),
-                'temperature': self.config.get('temperature', 1.0),
-                'top_p': self.config.get('top_p', 1.0),
-            }
-            
-            if tools:
-                kwargs['tools'] = tools
-            
-            response = self.client.chat.completions.create(**kwargs)
+            response = self.client.chat.completions.create(**self._request_kwargs(messages, tools))
             
             # Handle None tool_calls by ensuring it's always a list
             tool_calls = response.choices[0].message.tool_calls
@@ -80,6 +83,23 @@ class NvidiaProvider(BaseProvider):
         except Exception as e:
             raise Exception(f"NVIDIA NIM API call failed: {str(e)}")
     
+    def stream_chat_completion(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a chat completion from NVIDIA NIM as incremental deltas.
+        
+        Args:
+            messages: List of message dictionaries
+            tools: Optional list of tool definitions
+            
+        Yields:
+            Delta dictionaries (see BaseProvider.stream_chat_completion)
+        """
+        try:
+            stream = self.client.chat.completions.create(stream=True, **self._request_kwargs(messages, tools))
+            yield from self._openai_stream_deltas(stream)
+        except Exception as e:
+            raise Exception(f"NVIDIA NIM API call failed: {str(e)}")
+    
     def get_model_name(self) -> str:
         """Get the current model name."""
         return self.config.get('model', self.DEFAULT_MODEL)
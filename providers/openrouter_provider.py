@@ -2,8 +2,10 @@
 OpenRouter provider implementation.
 """
 
-from openai import OpenAI
-from typing import Dict, List, Any
+import asyncio
+import weakref
+from openai import AsyncOpenAI, OpenAI
+from typing import Dict, Iterator, List, Any
 from .base_provider import BaseProvider
 
 class OpenRouterProvider(BaseProvider):
@@ -19,6 +21,9 @@ class OpenRouterProvider(BaseProvider):
             base_url=self.config['base_url'],
             api_key=self.config['api_key']
         )
+        # Async clients are bound to the event loop they were created on, so one is kept
+        # per running loop and reused for connection pooling within it
+        self._async_clients = weakref.WeakKeyDictionary()
     
     def _validate_config(self):
         """Validate OpenRouter configuration."""
@@ -50,26 +55,79 @@ class OpenRouterProvider(BaseProvider):
                 messages=messages,
                 tools=tools
             )
+            return self._response_to_dict(response)
+        except Exception as e:
+            raise Exception(f"OpenRouter API call failed: {str(e)}")
+    
+    async def acreate_chat_completion(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Create a chat completion using the async OpenRouter client.
+        
+        Args:
+            messages: List of message dictionaries
+            tools: Optional list of tool definitions
             
-            # Handle None tool_calls by ensuring it's always a list
-            tool_calls = response.choices[0].message.tool_calls
-            if tool_calls is None:
-                tool_calls = []
-            
-            # Convert response to dict format
-            return {
-                'choices': [{
-                    'message': {
-                        'content': response.choices[0].message.content or "",
-                        'tool_calls': tool_calls
-                    }
-                }],
-                'usage': {
-                    'prompt_tokens': response.usage.prompt_tokens if response.usage else 0,
-                    'completion_tokens': response.usage.completion_tokens if response.usage else 0,
-                    'total_tokens': response.usage.total_tokens if response.usage else 0
+        Returns:
+            Dictionary containing the completion response
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            async_client = self._async_clients.get(loop)
+            if async_client is None:
+                async_client = self._async_clients[loop] = AsyncOpenAI(
+                    base_url=self.config['base_url'],
+                    api_key=self.config['api_key']
+                )
+            response = await async_client.chat.completions.create(
+                model=self.config['model'],
+                messages=messages,
+                tools=tools
+            )
+            return self._response_to_dict(response)
+        except Exception as e:
+            raise Exception(f"OpenRouter API call failed: {str(e)}")
+    
+    @staticmethod
+    def _response_to_dict(response: Any) -> Dict[str, Any]:
+        """Convert an SDK completion into the provider-neutral dict format."""
+        # Handle None tool_calls by ensuring it's always a list
+        tool_calls = response.choices[0].message.tool_calls
+        if tool_calls is None:
+            tool_calls = []
+        
+        return {
+            'choices': [{
+                'message': {
+                    'content': response.choices[0].message.content or "",
+                    'tool_calls': tool_calls
                 }
+            }],
+            'usage': {
+                'prompt_tokens': response.usage.prompt_tokens if response.usage else 0,
+                'completion_tokens': response.usage.completion_tokens if response.usage else 0,
+                'total_tokens': response.usage.total_tokens if response.usage else 0
             }
+        }
+    
+    def stream_chat_completion(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a chat completion from OpenRouter as incremental deltas.
+        
+        Args:
+            messages: List of message dictionaries
+            tools: Optional list of tool definitions
+            
+        Yields:
+            Delta dictionaries (see BaseProvider.stream_chat_completion)
+        """
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.config['model'],
+                messages=messages,
+                tools=tools,
+                stream=True
+            )
+            yield from self._openai_stream_deltas(stream)
         except Exception as e:
             raise Exception(f"OpenRouter API call failed: {str(e)}")
     
@@ -10,6 +10,14 @@ from .base_provider import BaseProvider
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Template for fallback usage; each response gets its own copy
+_ZERO_USAGE = {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
+
+
+def _fallback_response(content: str) -> Dict[str, Any]:
+    return {'choices': [{'message': {'content': content, 'tool_calls': []}}], 'usage': dict(_ZERO_USAGE)}
+
+
 class SambaNovaProvider(BaseProvider):
     """SambaNova provider using OpenAI-compatible API with robust error handling."""
     
@@ -180,23 +188,8 @@ class SambaNovaProvider(BaseProvider):
             logger.error(f"SambaNova API call failed: {str(e)}")
             logger.error(f"Error type: {type(e).__name__}")
             
-            # Provide a safe fallback response
-            fallback_response = {
-                'choices': [{
-                    'message': {
-                        'content': f"Error: SambaNova API call failed - {str(e)}",
-                        'tool_calls': []
-                    }
-                }],
-                'usage': {
-                    'prompt_tokens': 0,
-                    'completion_tokens': 0,
-                    'total_tokens': 0
-                }
-            }
-            
             logger.warning("Returning fallback response due to API failure")
-            return fallback_response
+            return _fallback_response(f"Error: SambaNova API call failed - {str(e)}")
     
     def get_model_name(self) -> str:
         """Get the current model name."""
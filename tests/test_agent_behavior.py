@@ -1,4 +1,7 @@
+import asyncio
 import json
+import threading
+import time
 
 import agent as agent_module
 
@@ -73,6 +76,7 @@ def build_agent(monkeypatch, responses):
         classmethod(lambda cls, provider_name, config: provider),
     )
 
+    monkeypatch.setattr(agent_module.AIAgent, "_tools_cache", {})
     monkeypatch.setattr(
         agent_module,
         "discover_tools",
@@ -124,3 +128,279 @@ def test_no_tool_responses_finalize_after_no_tool_streak(monkeypatch):
 
     assert result == "Draft analysis part one.\n\nDraft analysis part two."
     assert provider.calls == 2
+
+
+def test_load_config_reuses_parsed_config_until_file_changes(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("agent:\n  max_iterations: 3\n", encoding="utf-8")
+
+    first = agent_module.load_config(str(config_file))
+    second = agent_module.load_config(str(config_file))
+    assert first is second
+    assert first["agent"]["max_iterations"] == 3
+
+    config_file.write_text("agent:\n  max_iterations: 12\n", encoding="utf-8")
+    reloaded = agent_module.load_config(str(config_file))
+    assert reloaded is not first
+    assert reloaded["agent"]["max_iterations"] == 12
+
+
+def test_agents_sharing_config_reuse_discovered_tools(monkeypatch):
+    ai_agent, _ = build_agent(monkeypatch, [assistant_response("unused")])
+    second_agent = agent_module.AIAgent(provider_name="openrouter", silent=True)
+
+    assert second_agent.tools is ai_agent.tools
+    assert second_agent.tool_mapping is ai_agent.tool_mapping
+
+
+def test_tools_cache_is_keyed_by_config_content(monkeypatch):
+    ai_agent, _ = build_agent(monkeypatch, [assistant_response("unused")])
+    reparsed_config = json.loads(json.dumps(ai_agent.config))
+    monkeypatch.setattr(agent_module, "load_config", lambda config_path: reparsed_config)
+    same_content_agent = agent_module.AIAgent(provider_name="openrouter", silent=True)
+    assert same_content_agent.tools is ai_agent.tools
+
+    changed_config = dict(reparsed_config, search={"max_results": 1})
+    monkeypatch.setattr(agent_module, "load_config", lambda config_path: changed_config)
+    changed_agent = agent_module.AIAgent(provider_name="openrouter", silent=True)
+    assert changed_agent.tools is not ai_agent.tools
+
+
+def test_finalize_response_content_drops_near_duplicate_blocks(monkeypatch):
+    ai_agent, _ = build_agent(monkeypatch, [assistant_response("unused")])
+    base = " ".join(f"finding{i}" for i in range(60))
+    near_duplicate = base + " extra"
+    distinct = " ".join(f"other{i}" for i in range(60))
+
+    result = ai_agent._finalize_response_content([base, near_duplicate, distinct, "Short note.", "short   NOTE."])
+
+    assert result == "\n\n".join([base, distinct, "Short note."])
+
+
+def test_finalize_response_content_keeps_substantially_expanded_block(monkeypatch):
+    ai_agent, _ = build_agent(monkeypatch, [assistant_response("unused")])
+    words = [f"finding{i}" for i in range(100)]
+    base = " ".join(words)
+    expanded = " ".join(words + [f"detail{i}" for i in range(40)])
+
+    assert ai_agent._finalize_response_content([base, expanded]) == "\n\n".join([base, expanded])
+
+
+class StreamingProvider(SequencedProvider):
+    def __init__(self, streams):
+        super().__init__([])
+        self.streams = streams
+
+    def stream_chat_completion(self, messages, tools=None):
+        index = min(self.calls, len(self.streams) - 1)
+        self.calls += 1
+        yield from self.streams[index]
+
+
+def drain_stream(stream):
+    try:
+        while True:
+            next(stream)
+    except StopIteration as stop:
+        return stop.value
+
+
+def test_run_stream_yields_content_and_merges_tool_call_fragments(monkeypatch):
+    ai_agent, _ = build_agent(monkeypatch, [assistant_response("unused")])
+    completion_args = json.dumps({"task_summary": "done", "completion_message": "ok"})
+    ai_agent.provider = StreamingProvider([
+        [
+            {"content": "Streamed ", "tool_calls": []},
+            {"content": "finding.", "tool_calls": []},
+            {"tool_calls": [{"index": 0, "id": "call_1", "function": {"name": "mark_task_complete", "arguments": completion_args[:10]}}]},
+            {"tool_calls": [{"index": 0, "function": {"arguments": completion_args[10:]}}]},
+        ]
+    ])
+
+    stream = ai_agent.run_stream("research topic")
+    fragments = []
+    try:
+        while True:
+            fragments.append(next(stream))
+    except StopIteration as stop:
+        result = stop.value
+
+    assert "".join(fragments) == "Streamed finding."
+    assert result == "Streamed finding."
+    assert ai_agent.provider.calls == 1
+
+
+def test_multiple_tool_calls_in_one_turn_keep_result_order(monkeypatch):
+    search_calls = [
+        {
+            "id": f"call_search_{index}",
+            "type": "function",
+            "function": {"name": "search_web", "arguments": json.dumps({"query": f"q{index}"})},
+        }
+        for index in range(3)
+    ]
+    responses = [
+        assistant_response("Researching.", search_calls),
+        assistant_response("Final answer.", [completion_tool_call()]),
+    ]
+
+    ai_agent, provider = build_agent(monkeypatch, responses)
+    seen_messages = []
+    original_create = provider.create_chat_completion
+
+    def recording_create(messages, tools=None):
+        seen_messages.append(list(messages))
+        return original_create(messages, tools)
+
+    provider.create_chat_completion = recording_create
+    ai_agent.run("research topic")
+
+    tool_messages = [message for message in seen_messages[-1] if message["role"] == "tool"]
+    assert [message["tool_call_id"] for message in tool_messages] == [call["id"] for call in search_calls]
+    assert [json.loads(message["content"])["args"]["query"] for message in tool_messages] == ["q0", "q1", "q2"]
+
+
+def test_repeated_idempotent_tool_call_is_served_from_run_cache(monkeypatch):
+    search_call = {
+        "id": "call_search",
+        "type": "function",
+        "function": {"name": "search_web", "arguments": json.dumps({"query": "same"})},
+    }
+    responses = [
+        assistant_response("First pass.", [search_call]),
+        assistant_response("Second pass.", [dict(search_call, id="call_search_again")]),
+        assistant_response("Done.", [completion_tool_call()]),
+    ]
+
+    ai_agent, _ = build_agent(monkeypatch, responses)
+    executions = []
+    ai_agent._idempotent_tools = frozenset({"search_web"})
+    ai_agent.tool_mapping = dict(
+        ai_agent.tool_mapping,
+        search_web=lambda **kwargs: executions.append(kwargs) or {"results": [kwargs["query"]]},
+    )
+
+    ai_agent.run("research topic")
+
+    assert executions == [{"query": "same"}]
+
+
+def test_arun_matches_run_with_async_provider(monkeypatch):
+    class AsyncSequencedProvider(SequencedProvider):
+        async def acreate_chat_completion(self, messages, tools=None):
+            return self.create_chat_completion(messages, tools)
+
+    responses = [
+        assistant_response("Async draft.", [
+            {"id": "call_search", "type": "function", "function": {"name": "search_web", "arguments": "{}"}}
+        ]),
+        assistant_response("", [completion_tool_call()]),
+    ]
+    ai_agent, _ = build_agent(monkeypatch, responses)
+    provider = AsyncSequencedProvider(responses)
+    ai_agent.provider = provider
+
+    result = asyncio.run(ai_agent.arun("question"))
+
+    assert result == "Async draft."
+    assert provider.calls == 2
+
+
+def test_response_cache_replays_final_answer_when_enabled(monkeypatch):
+    responses = [
+        assistant_response("Cached answer."),
+        assistant_response("Cached answer."),
+    ]
+    ai_agent, provider = build_agent(monkeypatch, responses)
+    monkeypatch.setattr(agent_module, "_response_cache", agent_module.OrderedDict())
+    ai_agent.config = dict(ai_agent.config, agent={"response_cache": True})
+
+    assert ai_agent.run("same question") == "Cached answer."
+    calls_after_first_run = provider.calls
+    assert ai_agent.run("same question") == "Cached answer."
+    assert provider.calls == calls_after_first_run
+
+    ai_agent.run("different question")
+    assert provider.calls > calls_after_first_run
+
+
+def test_malformed_tool_arguments_are_parsed_once_and_reported(monkeypatch):
+    bad_call = {"id": "call_bad", "type": "function", "function": {"name": "search_web", "arguments": "{not json"}}
+    responses = [
+        assistant_response("Partial work.", [bad_call]),
+        assistant_response("", [completion_tool_call()]),
+    ]
+    ai_agent, _ = build_agent(monkeypatch, responses)
+
+    parse_calls = []
+    original_parse = ai_agent._parse_tool_arguments
+    monkeypatch.setattr(ai_agent, "_parse_tool_arguments", lambda raw: parse_calls.append(raw) or original_parse(raw))
+
+    loop = ai_agent._agent_loop("question")
+    messages = next(loop)
+    messages = loop.send(responses[0])
+
+    tool_message = messages[-1]
+    assert tool_message["tool_call_id"] == "call_bad"
+    assert "Tool execution failed" in json.loads(tool_message["content"])["error"]
+    assert parse_calls == ["{not json"]
+
+
+def test_run_stream_starts_finished_idempotent_call_before_stream_ends(monkeypatch):
+    ai_agent, _ = build_agent(monkeypatch, [assistant_response("unused")])
+    started = threading.Event()
+    executions = []
+    ai_agent._idempotent_tools = frozenset({"search_web"})
+    ai_agent.tool_mapping = dict(
+        ai_agent.tool_mapping,
+        search_web=lambda **kwargs: executions.append(kwargs) or started.set() or {"results": []},
+    )
+    completion_args = json.dumps({"task_summary": "done", "completion_message": "ok"})
+
+    def stream():
+        yield {"content": "Found it.", "tool_calls": []}
+        yield {"tool_calls": [{"index": 0, "id": "call_search", "function": {"name": "search_web", "arguments": '{"query":'}}]}
+        yield {"tool_calls": [{"index": 0, "function": {"arguments": ' "x"}'}}]}
+        yield {"tool_calls": [{"index": 1, "id": "call_done", "function": {"name": "mark_task_complete", "arguments": ""}}]}
+        # The search call is complete once index 1 begins, so it must already be running.
+        assert started.wait(timeout=2)
+        yield {"tool_calls": [{"index": 1, "function": {"arguments": completion_args}}]}
+
+    ai_agent.provider = StreamingProvider([stream()])
+    result = drain_stream(ai_agent.run_stream("research topic"))
+
+    assert result == "Found it."
+    assert executions == [{"query": "x"}]
+
+
+def test_stateful_tool_calls_in_one_turn_run_in_model_order(monkeypatch):
+    tool_calls = [
+        {"id": "call_write", "type": "function", "function": {"name": "write_file", "arguments": json.dumps({"path": "notes.txt", "content": "saved"})}},
+        {"id": "call_read", "type": "function", "function": {"name": "read_file", "arguments": json.dumps({"path": "notes.txt"})}},
+    ]
+    responses = [
+        assistant_response("Writing notes.", tool_calls),
+        assistant_response("", [completion_tool_call()]),
+    ]
+    ai_agent, _ = build_agent(monkeypatch, responses)
+    files = {}
+
+    def write_file(path, content):
+        # A concurrent read would finish while this write is still sleeping.
+        time.sleep(0.05)
+        files[path] = content
+        return {"written": path}
+
+    ai_agent.tool_mapping = dict(
+        ai_agent.tool_mapping,
+        write_file=write_file,
+        read_file=lambda path: {"content": files.get(path)},
+    )
+
+    loop = ai_agent._agent_loop("question")
+    next(loop)
+    messages = loop.send(responses[0])
+
+    read_message = messages[-1]
+    assert read_message["tool_call_id"] == "call_read"
+    assert json.loads(read_message["content"]) == {"content": "saved"}
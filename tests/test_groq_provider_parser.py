@@ -25,3 +25,15 @@ def test_extract_text_without_function_calls_preserves_plain_answer():
     cleaned = provider._extract_text_without_function_calls(payload)
     assert "Long answer body with useful details." in cleaned
     assert "<function=" not in cleaned
+
+
+def test_validate_tools_reuses_result_for_same_tools_list():
+    provider = GroqProvider.__new__(GroqProvider)
+    tools = [{"function": {"name": "search_web"}}]
+
+    first = provider._validate_tools(tools)
+    second = provider._validate_tools(tools)
+
+    assert first is second
+    assert first[0]["type"] == "function"
+    assert first[0]["function"]["parameters"] == {"type": "object", "properties": {}}
@@ -1,3 +1,4 @@
+import asyncio
 import orchestrator as orchestrator_module
 import threading
 
@@ -13,6 +14,7 @@ def test_fallback_subtasks_match_requested_count_and_question_style():
 
 class FakeQuestionAgent:
     instances = []
+    runs = 0
 
     def __init__(self, silent=True, provider_name=None):
         self.tools = [
@@ -26,6 +28,7 @@ class FakeQuestionAgent:
         FakeQuestionAgent.instances.append(self)
 
     def run(self, prompt):
+        FakeQuestionAgent.runs += 1
         return '["Question A?", "Question B?"]'
 
 
@@ -35,6 +38,7 @@ def test_question_generation_disables_only_completion_tool(monkeypatch):
 
     orchestrator = orchestrator_module.TaskOrchestrator.__new__(orchestrator_module.TaskOrchestrator)
     orchestrator.provider_name = "openrouter"
+    orchestrator._agent_pools = orchestrator_module.defaultdict(orchestrator_module.queue.SimpleQueue)
     orchestrator.config = {
         "orchestrator": {
             "question_generation_prompt": "Prompt for {user_input} and {num_agents}",
@@ -52,6 +56,31 @@ def test_question_generation_disables_only_completion_tool(monkeypatch):
     assert "search_web" in question_agent.tool_mapping
 
 
+def test_question_generation_reuses_cached_subtasks(monkeypatch):
+    FakeQuestionAgent.instances = []
+    FakeQuestionAgent.runs = 0
+    monkeypatch.setattr(orchestrator_module, "AIAgent", FakeQuestionAgent)
+    monkeypatch.setattr(orchestrator_module, "_subtask_cache", orchestrator_module.OrderedDict())
+
+    orchestrator = orchestrator_module.TaskOrchestrator.__new__(orchestrator_module.TaskOrchestrator)
+    orchestrator.provider_name = "openrouter"
+    orchestrator._agent_pools = orchestrator_module.defaultdict(orchestrator_module.queue.SimpleQueue)
+    orchestrator.config = {
+        "orchestrator": {
+            "question_generation_prompt": "Prompt for {user_input} and {num_agents}",
+            "subtask_cache": True,
+        }
+    }
+
+    first = orchestrator.decompose_task("topic", 2)
+    second = orchestrator.decompose_task("topic", 2)
+    other = orchestrator.decompose_task("other topic", 2)
+
+    assert first == second == other == ["Question A?", "Question B?"]
+    assert FakeQuestionAgent.runs == 2
+    assert len(FakeQuestionAgent.instances) == 1
+
+
 class FlakyAgent:
     calls = 0
 
@@ -71,9 +100,11 @@ def test_run_agent_parallel_retries_transient_failures(monkeypatch):
 
     orchestrator = orchestrator_module.TaskOrchestrator.__new__(orchestrator_module.TaskOrchestrator)
     orchestrator.provider_name = "groq"
+    orchestrator._agent_pools = orchestrator_module.defaultdict(orchestrator_module.queue.SimpleQueue)
     orchestrator.agent_retry_attempts = 2
     orchestrator.agent_retry_backoff_seconds = 0
     orchestrator.progress_lock = threading.Lock()
+    orchestrator.progress_event = threading.Event()
     orchestrator.agent_progress = {}
     orchestrator.agent_results = {}
 
@@ -84,6 +115,79 @@ def test_run_agent_parallel_retries_transient_failures(monkeypatch):
     assert FlakyAgent.calls == 2
 
 
+def test_run_agent_parallel_uses_prewarmed_agent_first(monkeypatch):
+    FlakyAgent.calls = 0
+    monkeypatch.setattr(orchestrator_module, "AIAgent", FlakyAgent)
+
+    class PrewarmedAgent:
+        def run(self, subtask):
+            return f"Prewarmed response for: {subtask}"
+
+    orchestrator = orchestrator_module.TaskOrchestrator.__new__(orchestrator_module.TaskOrchestrator)
+    orchestrator.provider_name = "openrouter"
+    orchestrator._agent_pools = orchestrator_module.defaultdict(orchestrator_module.queue.SimpleQueue)
+    orchestrator.agent_retry_attempts = 2
+    orchestrator.agent_retry_backoff_seconds = 0
+    orchestrator.progress_lock = threading.Lock()
+    orchestrator.progress_event = threading.Event()
+    orchestrator.agent_progress = {}
+    orchestrator.agent_results = {}
+
+    agent_future = orchestrator_module.Future()
+    agent_future.set_result(PrewarmedAgent())
+    result = orchestrator.run_agent_parallel(0, "subtask", agent_future)
+
+    assert result["response"] == "Prewarmed response for: subtask"
+    assert FlakyAgent.calls == 0
+
+
+def test_wait_for_agents_stops_after_quorum_and_grace_period():
+    orchestrator = orchestrator_module.TaskOrchestrator.__new__(orchestrator_module.TaskOrchestrator)
+    orchestrator.task_timeout = 30
+    orchestrator.synthesis_quorum = 2
+    orchestrator.straggler_grace_seconds = 0
+
+    finished = []
+    for agent_id in range(2):
+        future = orchestrator_module.Future()
+        future.set_result({"agent_id": agent_id, "status": "success", "response": "ok"})
+        finished.append(future)
+    straggler = orchestrator_module.Future()
+
+    done, not_done, quorum_reached = orchestrator._wait_for_agents(finished + [straggler])
+
+    assert done == set(finished)
+    assert not_done == {straggler}
+    assert quorum_reached
+
+
+def test_duplicate_subtasks_map_to_their_first_slot():
+    subtasks = ["Question A?", "Question B?", "Question A?", "Question A?"]
+
+    duplicates = orchestrator_module.TaskOrchestrator._duplicate_slots(subtasks)
+
+    assert duplicates == {2: 0, 3: 0}
+
+
+def test_late_worker_update_does_not_overwrite_timeout():
+    orchestrator = orchestrator_module.TaskOrchestrator.__new__(orchestrator_module.TaskOrchestrator)
+    orchestrator.num_agents = 2
+    orchestrator.progress_lock = threading.Lock()
+    orchestrator.progress_event = threading.Event()
+    orchestrator._reset_progress()
+    orchestrator._queue_agents()
+
+    orchestrator.update_agent_progress(0, "TIMEOUT")
+    orchestrator.update_agent_progress(0, "COMPLETED", "late answer")
+    orchestrator.update_agent_progress(1, "COMPLETED", "answer")
+
+    assert orchestrator.get_progress_status() == {0: "TIMEOUT", 1: "COMPLETED"}
+    assert orchestrator.agent_results == {1: "answer"}
+
+    orchestrator._queue_agents([0])
+    assert orchestrator.get_progress_status() == {0: "QUEUED", 1: "COMPLETED"}
+
+
 def test_aggregate_results_shows_failure_reasons():
     orchestrator = orchestrator_module.TaskOrchestrator.__new__(orchestrator_module.TaskOrchestrator)
     orchestrator.aggregation_strategy = "consensus"
@@ -118,3 +222,115 @@ def test_aggregate_results_auth_failure_message_for_groq():
     message = orchestrator.aggregate_results(results)
     assert "Authentication failed for provider 'groq'" in message
     assert "starts with 'gsk_'" in message
+
+
+class FakeSynthesisAgent:
+    runs = 0
+
+    def __init__(self, silent=True, provider_name=None):
+        self.tools = []
+        self.tool_mapping = {}
+
+    def run(self, prompt):
+        FakeSynthesisAgent.runs += 1
+        return "Synthesized answer"
+
+
+def test_consensus_reuses_synthesis_for_same_responses(monkeypatch):
+    FakeSynthesisAgent.runs = 0
+    monkeypatch.setattr(orchestrator_module, "AIAgent", FakeSynthesisAgent)
+    monkeypatch.setattr(orchestrator_module, "_synthesis_cache", orchestrator_module.OrderedDict())
+
+    orchestrator = orchestrator_module.TaskOrchestrator.__new__(orchestrator_module.TaskOrchestrator)
+    orchestrator.provider_name = "openrouter"
+    orchestrator._agent_pools = orchestrator_module.defaultdict(orchestrator_module.queue.SimpleQueue)
+    orchestrator.config = {
+        "orchestrator": {
+            "synthesis_prompt": "{num_responses}: {agent_responses}",
+            "synthesis_cache": True,
+        }
+    }
+    orchestrator.progress_lock = threading.Lock()
+    orchestrator.progress_event = threading.Event()
+
+    first = orchestrator._aggregate_consensus(["Answer one", "Answer two"], [])
+    second = orchestrator._aggregate_consensus(["Answer two", "Answer one"], [])
+
+    assert first == second == "Synthesized answer"
+    assert FakeSynthesisAgent.runs == 1
+    assert orchestrator.get_synthesis_status() == "COMPLETED"
+
+
+def test_consensus_skips_synthesis_for_identical_responses(monkeypatch):
+    FakeSynthesisAgent.runs = 0
+    monkeypatch.setattr(orchestrator_module, "AIAgent", FakeSynthesisAgent)
+
+    orchestrator = orchestrator_module.TaskOrchestrator.__new__(orchestrator_module.TaskOrchestrator)
+    orchestrator.provider_name = "openrouter"
+    orchestrator._agent_pools = orchestrator_module.defaultdict(orchestrator_module.queue.SimpleQueue)
+    orchestrator.config = {"orchestrator": {"synthesis_prompt": "{num_responses}: {agent_responses}"}}
+    orchestrator.progress_lock = threading.Lock()
+    orchestrator.progress_event = threading.Event()
+
+    answer = orchestrator._aggregate_consensus(["The answer is 42.", "the answer is 42."], [])
+    distinct = orchestrator._aggregate_consensus(["The answer is 42.", "The answer is 7."], [])
+
+    assert answer == "The answer is 42."
+    assert distinct == "Synthesized answer"
+    assert FakeSynthesisAgent.runs == 1
+
+
+def test_near_identical_response_compares_every_pair():
+    words = [f"finding{i}" for i in range(100)]
+    first = " ".join(words)
+    second = " ".join(words + ["extra0", "extra1", "extra2"])
+    third = " ".join("changed" if i == 50 else word for i, word in enumerate(words))
+    near_identical = orchestrator_module.TaskOrchestrator._near_identical_response
+
+    # Both variants are close to the first response but not to each other.
+    assert near_identical([first, second]) is not None
+    assert near_identical([first, third]) is not None
+    assert near_identical([first, second, third]) is None
+
+
+class FakeAsyncAgent:
+    def __init__(self, silent=True, provider_name=None):
+        self.tools = []
+        self.tool_mapping = {}
+
+    def run(self, prompt):
+        return "Synthesized answer"
+
+    async def arun(self, subtask):
+        await asyncio.sleep(0)
+        return f"Async response for: {subtask}"
+
+
+def test_orchestrate_async_runs_agents_on_the_event_loop(monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "AIAgent", FakeAsyncAgent)
+
+    orchestrator = orchestrator_module.TaskOrchestrator.__new__(orchestrator_module.TaskOrchestrator)
+    orchestrator.provider_name = "openrouter"
+    orchestrator._agent_pools = orchestrator_module.defaultdict(orchestrator_module.queue.SimpleQueue)
+    orchestrator.num_agents = 3
+    orchestrator.max_concurrency = 2
+    orchestrator.task_timeout = 30
+    orchestrator.synthesis_quorum = 0
+    orchestrator.agent_stagger_seconds = 0
+    orchestrator.agent_retry_attempts = 1
+    orchestrator.agent_retry_backoff_seconds = 0
+    orchestrator.sequential_fallback_on_total_failure = True
+    orchestrator.aggregation_strategy = "consensus"
+    orchestrator.config = {
+        "orchestrator": {
+            "question_generation_prompt": "Prompt for {user_input} and {num_agents}",
+            "synthesis_prompt": "{num_responses}: {agent_responses}",
+        }
+    }
+    orchestrator.progress_lock = threading.Lock()
+    orchestrator.progress_event = threading.Event()
+
+    result = asyncio.run(orchestrator.orchestrate_async("topic"))
+
+    assert result == "Synthesized answer"
+    assert orchestrator.get_progress_status() == {0: "COMPLETED", 1: "COMPLETED", 2: "COMPLETED"}
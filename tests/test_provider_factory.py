@@ -0,0 +1,49 @@
+from collections import OrderedDict
+
+from providers import ProviderFactory
+from providers.base_provider import BaseProvider
+
+
+class RecordingProvider(BaseProvider):
+    created = 0
+
+    def __init__(self, config):
+        RecordingProvider.created += 1
+        super().__init__(config)
+
+    def _validate_config(self):
+        self.config.setdefault("model", "default-model")
+
+    def create_chat_completion(self, messages, tools=None):
+        return {}
+
+    def get_model_name(self):
+        return self.config["model"]
+
+
+def test_create_provider_reuses_instances_for_equal_configs(monkeypatch):
+    RecordingProvider.created = 0
+    monkeypatch.setitem(ProviderFactory._provider_classes, "ollama", RecordingProvider)
+    monkeypatch.setattr(ProviderFactory, "_instances", OrderedDict())
+
+    config = {"base_url": "http://localhost:11434", "stop": []}
+    first = ProviderFactory.create_provider("ollama", config)
+    again = ProviderFactory.create_provider("ollama", config)
+    copy = ProviderFactory.create_provider("ollama", {"base_url": "http://localhost:11434", "stop": []})
+    other = ProviderFactory.create_provider("ollama", {"base_url": "http://remote:11434", "stop": []})
+
+    assert first is again is copy
+    assert other is not first
+    assert RecordingProvider.created == 2
+
+
+def test_create_provider_validates_a_copy_of_the_config(monkeypatch):
+    monkeypatch.setitem(ProviderFactory._provider_classes, "ollama", RecordingProvider)
+    monkeypatch.setattr(ProviderFactory, "_instances", OrderedDict())
+
+    config = {"base_url": "http://localhost:11434"}
+    provider = ProviderFactory.create_provider("ollama", config)
+
+    assert provider.config["model"] == "default-model"
+    assert "model" not in config
+    assert ProviderFactory.create_provider("ollama", dict(config, model="default-model")) is provider
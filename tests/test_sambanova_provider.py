@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("openai")
+
+from providers import sambanova_provider as sambanova_module
+
+
+class FailingCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        raise RuntimeError(f"outage {self.calls}")
+
+
+class FailingClient:
+    def __init__(self):
+        self.chat = type("Chat", (), {"completions": FailingCompletions()})()
+
+
+def test_fallback_responses_get_independent_zero_usage():
+    provider = sambanova_module.SambaNovaProvider.__new__(sambanova_module.SambaNovaProvider)
+    provider.config = {"model": "test-model"}
+    provider.client = FailingClient()
+
+    first = provider.create_chat_completion([{"role": "user", "content": "hi"}])
+    second = provider.create_chat_completion([{"role": "user", "content": "hi"}])
+
+    assert first["choices"][0]["message"]["content"] == "Error: SambaNova API call failed - outage 1"
+    assert second["choices"][0]["message"]["content"] == "Error: SambaNova API call failed - outage 2"
+    assert first["choices"] is not second["choices"]
+
+    zero_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    assert first["usage"] == zero_usage
+    first["usage"]["total_tokens"] = 99
+    third = provider.create_chat_completion([{"role": "user", "content": "hi"}])
+    assert second["usage"] == third["usage"] == zero_usage
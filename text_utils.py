@@ -0,0 +1,58 @@
+"""
+JSON and text-similarity helpers shared by the agent and the orchestrator.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson serializes datetime/UUID/dataclass values natively and, with OPT_NON_STR_KEYS, non-string keys.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Serialize to JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        options = _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _ORJSON_OPTIONS
+        try:
+            return orjson.dumps(obj, default=str, option=options).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits or deeply nested data; the stdlib handles those.
+            pass
+    return json.dumps(obj, default=str, sort_keys=sort_keys)
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib type either way.
+loads = orjson.loads if orjson is not None else json.loads
+
+
+# Near-duplicate detection for response blocks (word shingles compared as hashed sets).
+# For appended or diverging text, shingle Dice tracks difflib's ratio closely, so the old
+# 0.94 cut-off still keeps any later block that grew by more than about 6%.
+SHINGLE_SIZE = 5
+SIMILARITY_THRESHOLD = 0.94
+MIN_SIMILARITY_LENGTH = 100
+
+
+def shingle_fingerprint(normalized: str) -> frozenset:
+    """Hash every run of SHINGLE_SIZE consecutive words of a normalized block."""
+    words = normalized.split(" ")
+    if len(words) <= SHINGLE_SIZE:
+        return frozenset((hash(normalized),))
+    return frozenset(
+        hash(tuple(words[i:i + SHINGLE_SIZE]))
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    )
+
+
+def fingerprint_similarity(first: frozenset, second: frozenset) -> float:
+    """Dice coefficient of two fingerprints (2*M/T, the same shape as difflib's ratio)."""
+    total = len(first) + len(second)
+    if not total:
+        return 1.0
+    return 2.0 * len(first & second) / total
@@ -4,6 +4,9 @@ from typing import Dict, Any, List
 class BaseTool(ABC):
     """Base class for all tools"""
     
+    # Same arguments always give the same result, so the agent may reuse results within a run
+    idempotent = False
+    
     @property
     @abstractmethod
     def name(self) -> str:
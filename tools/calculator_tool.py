@@ -4,6 +4,8 @@ import ast
 import operator
 
 class CalculatorTool(BaseTool):
+    idempotent = True
+
     def __init__(self, config: dict):
         self.config = config
         # Safe operators for evaluation
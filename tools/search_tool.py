@@ -19,6 +19,8 @@ except ImportError:
         DDGS = None
 
 class SearchTool(BaseTool):
+    idempotent = True
+
     def __init__(self, config: dict):
         self.config = config
     